@@ -1,5 +1,6 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 import logging
+from . import controllers
 from . import models
 from . import services
 from . import graphql
@@ -1,7 +1,7 @@
 {
     'name': 'MONEI',
     'author': 'MONEI',
-    'version': '1.0.0',
+    'version': '1.0.2',
     'category': 'Accounting',
     'sequence': 350,
     'website': 'https://monei.com',
@@ -10,11 +10,17 @@
     'depends': ['base', 'sale'],
     'data': [
         'security/ir.model.access.csv',
+        'security/monei_security.xml',
+        'data/monei_cron.xml',
         'views/res_config_views.xml',
         'views/send_link_wizard_views.xml',
         'views/sync_wizard_views.xml',
         'views/create_wizard_views.xml',
         'views/monei_payment_views.xml',
+        'views/monei_payment_report_views.xml',
+        'views/monei_payment_daily_views.xml',
+        'views/monei_sync_run_views.xml',
+        'views/monei_store_views.xml',
         'views/monei_menus.xml',
         'views/cancel_wizard_views.xml',
         'views/refund_wizard_views.xml',
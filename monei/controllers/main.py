@@ -0,0 +1,27 @@
+import hmac
+
+from odoo import http
+from odoo.http import request
+
+from ..services import metrics
+
+
+class MoneiMetricsController(http.Controller):
+
+    @http.route('/monei/metrics', type='http', auth='public', methods=['GET'], csrf=False, save_session=False)
+    def metrics(self, **kwargs):
+        """Expose the MONEI API metrics of all workers in the Prometheus format
+
+        The endpoint is disabled until the monei.metrics_token system parameter
+        is set, scrapers then authenticate with "Authorization: Bearer <token>".
+        """
+        token = request.env['ir.config_parameter'].sudo().get_param('monei.metrics_token')
+        if not token:
+            raise request.not_found()
+        authorization = request.httprequest.headers.get('Authorization', '')
+        if not hmac.compare_digest(authorization, f'Bearer {token}'):
+            return request.make_response('Unauthorized', status=401, headers=[('WWW-Authenticate', 'Bearer')])
+        return request.make_response(
+            metrics.render_prometheus(),
+            headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')],
+        )
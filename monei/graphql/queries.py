@@ -1,196 +1,237 @@
+# Charge fields stored by every sync
+CHARGE_CORE_FIELDS = """
+    id
+    accountId
+    providerId
+    checkoutId
+    providerInternalId
+    providerReferenceId
+    createdAt
+    updatedAt
+    amount
+    authorizationCode
+    billingDetails {
+        email
+        name
+        company
+        phone
+        address {
+            city
+            country
+            line1
+            line2
+            zip
+            state
+        }
+        taxId
+    }
+    billingPlan
+    currency
+    customer {
+        email
+        name
+        phone
+    }
+    description
+    descriptor
+    livemode
+    orderId
+    storeId
+    pointOfSaleId
+    terminalId
+    sequenceId
+    subscriptionId
+    paymentMethod {
+        method
+        card {
+            brand
+            country
+            type
+            threeDSecure
+            threeDSecureVersion
+            threeDSecureFlow
+            last4
+            cardholderName
+            cardholderEmail
+            expiration
+            bank
+            tokenizationMethod
+        }
+        cardPresent {
+            brand
+            country
+            type
+            bin
+            last4
+            cardholderName
+            cardholderEmail
+            expiration
+        }
+        bizum {
+            phoneNumber
+            integrationType
+        }
+        paypal {
+            orderId
+            payerId
+            email
+            name
+        }
+        cofidis {
+            orderId
+        }
+        cofidisLoan {
+            orderId
+        }
+        trustly {
+            customerId
+        }
+        sepa {
+            accountholderAddress {
+                city
+                country
+                line1
+                line2
+                zip
+                state
+            }
+            accountholderEmail
+            accountholderName
+            countryCode
+            bankAddress
+            bankCode
+            bankName
+            bic
+            last4
+        }
+        klarna {
+            billingCategory
+            authPaymentMethod
+        }
+        mbway {
+            phoneNumber
+        }
+    }
+    cancellationReason
+    lastRefundAmount
+    lastRefundReason
+    refundedAmount
+    shippingDetails {
+        email
+        name
+        company
+        phone
+        address {
+            city
+            country
+            line1
+            line2
+            zip
+            state
+        }
+        taxId
+    }
+    shop {
+        name
+        country
+    }
+    status
+    statusCode
+    statusMessage
+    pageOpenedAt
+"""
+
+# Heavy detail blocks, skipped by the sync in lazy details mode and
+# fetched per charge with CHARGE_DETAILS_QUERY instead
+CHARGE_DETAIL_FIELDS = """
+    sessionDetails {
+        ip
+        userAgent
+        countryCode
+        lang
+        deviceType
+        deviceModel
+        browser
+        browserVersion
+        browserAccept
+        browserColorDepth
+        browserScreenHeight
+        browserScreenWidth
+        browserTimezoneOffset
+        os
+        osVersion
+        source
+        sourceVersion
+    }
+    traceDetails {
+        ip
+        userAgent
+        countryCode
+        lang
+        deviceType
+        deviceModel
+        browser
+        browserVersion
+        browserAccept
+        os
+        osVersion
+        source
+        sourceVersion
+        userId
+        userEmail
+        userName
+    }
+    metadata {
+        key
+        value
+    }
+"""
+
 CHARGES_QUERY = """
 query {
     charges%s {
+        total
         items {
-            id
-            accountId
-            providerId
-            checkoutId
-            providerInternalId
-            providerReferenceId
-            createdAt
-            updatedAt
-            amount
-            authorizationCode
-            billingDetails {
-                email
-                name
-                company
-                phone
-                address {
-                    city
-                    country
-                    line1
-                    line2
-                    zip
-                    state
-                }
-                taxId
-            }
-            billingPlan
-            currency
-            customer {
-                email
-                name
-                phone
-            }
-            description
-            descriptor
-            livemode
-            orderId
-            storeId
-            pointOfSaleId
-            terminalId
-            sequenceId
-            subscriptionId
-            paymentMethod {
-                method
-                card {
-                    brand
-                    country
-                    type
-                    threeDSecure
-                    threeDSecureVersion
-                    threeDSecureFlow
-                    last4
-                    cardholderName
-                    cardholderEmail
-                    expiration
-                    bank
-                    tokenizationMethod
-                }
-                cardPresent {
-                    brand
-                    country
-                    type
-                    bin
-                    last4
-                    cardholderName
-                    cardholderEmail
-                    expiration
-                }
-                bizum {
-                    phoneNumber
-                    integrationType
-                }
-                paypal {
-                    orderId
-                    payerId
-                    email
-                    name
-                }
-                cofidis {
-                    orderId
-                }
-                cofidisLoan {
-                    orderId
-                }
-                trustly {
-                    customerId
-                }
-                sepa {
-                    accountholderAddress {
-                        city
-                        country
-                        line1
-                        line2
-                        zip
-                        state
-                    }
-                    accountholderEmail
-                    accountholderName
-                    countryCode
-                    bankAddress
-                    bankCode
-                    bankName
-                    bic
-                    last4
-                }
-                klarna {
-                    billingCategory
-                    authPaymentMethod
-                }
-                mbway {
-                    phoneNumber
-                }
-            }
-            cancellationReason
-            lastRefundAmount
-            lastRefundReason
-            refundedAmount
-            shippingDetails {
-                email
-                name
-                company
-                phone
-                address {
-                    city
-                    country
-                    line1
-                    line2
-                    zip
-                    state
-                }
-                taxId
-            }
-            shop {
-                name
-                country
-            }
-            status
-            statusCode
-            statusMessage
-            sessionDetails {
-                ip
-                userAgent
-                countryCode
-                lang
-                deviceType
-                deviceModel
-                browser
-                browserVersion
-                browserAccept
-                browserColorDepth
-                browserScreenHeight
-                browserScreenWidth
-                browserTimezoneOffset
-                os
-                osVersion
-                source
-                sourceVersion
-            }
-            traceDetails {
-                ip
-                userAgent
-                countryCode
-                lang
-                deviceType
-                deviceModel
-                browser
-                browserVersion
-                browserAccept
-                os
-                osVersion
-                source
-                sourceVersion
-                userId
-                userEmail
-                userName
-            }
-            pageOpenedAt
-            metadata {
-                key
-                value
-            }
+            %s
+            %s
         }
+    }
+}
+""" % ('%s', CHARGE_CORE_FIELDS, CHARGE_DETAIL_FIELDS)
+
+CHARGES_CORE_QUERY = """
+query {
+    charges%s {
         total
+        items {
+            %s
+        }
     }
 }
-"""
+""" % ('%s', CHARGE_CORE_FIELDS)
+
+CHARGE_DETAILS_QUERY = """
+query Charge($id: ID!) {
+    charge(id: $id) {
+        id
+        %s
+    }
+}
+""" % CHARGE_DETAIL_FIELDS
+
+CHARGE_QUERY = """
+query Charge($id: ID!) {
+    charge(id: $id) {
+        %s
+        %s
+    }
+}
+""" % (CHARGE_CORE_FIELDS, CHARGE_DETAIL_FIELDS)
 
 ACCOUNT_QUERY = """
 query Account{
     account {
+        id
         apiKey
     }
 }
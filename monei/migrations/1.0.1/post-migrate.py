@@ -0,0 +1,88 @@
+import json
+
+from odoo import SUPERUSER_ID, api
+from odoo.tools import SQL, split_every
+from odoo.tools.sql import column_exists
+
+from odoo.addons.monei.services.charge_mapping import metadata as convert_metadata
+
+# Payment link and model of the detail blocks that left the monei_payment table
+DETAIL_MODELS = [
+    ('address_id', 'monei.payment.address'),
+    ('session_detail_id', 'monei.payment.session'),
+    ('method_detail_id', 'monei.payment.method.detail'),
+]
+
+BATCH_SIZE = 1000
+
+
+def _move_details(env, link, model_name):
+    """Copy the old detail columns of the payments into companion rows, then drop them"""
+    cr = env.cr
+    Detail = env[model_name]
+    columns = [
+        fname for fname, field in Detail._fields.items()
+        if field.store and not field.automatic and column_exists(cr, 'monei_payment', fname)
+    ]
+    if not columns:
+        return
+    cr.execute(SQL(
+        "SELECT id, %s FROM monei_payment WHERE %s IS NULL AND (%s) ORDER BY id",
+        SQL(', ').join(SQL.identifier(column) for column in columns),
+        SQL.identifier(link),
+        SQL(' OR ').join(SQL('%s IS NOT NULL', SQL.identifier(column)) for column in columns),
+    ))
+    for rows in split_every(BATCH_SIZE, cr.fetchall(), list):
+        details = Detail.create([dict(zip(columns, row[1:])) for row in rows])
+        cr.execute(SQL(
+            "UPDATE monei_payment SET %s = v.detail_id FROM (VALUES %s) AS v(id, detail_id) WHERE monei_payment.id = v.id",
+            SQL.identifier(link),
+            SQL(', ').join(SQL('(%s, %s)', row[0], detail_id) for row, detail_id in zip(rows, details.ids)),
+        ))
+    for column in columns:
+        cr.execute(SQL('ALTER TABLE monei_payment DROP COLUMN %s', SQL.identifier(column)))
+
+
+def _convert_metadata(env):
+    """Fill the jsonb metadata from the text column it replaced, then drop it
+
+    The text column holds the GraphQL [{key, value}] list and was renamed
+    metadata_moved<n> by the ORM when the column type changed.
+    """
+    cr = env.cr
+    cr.execute("""
+        SELECT column_name
+          FROM information_schema.columns
+         WHERE table_name = 'monei_payment' AND column_name LIKE 'metadata\\_moved%'
+      ORDER BY column_name
+    """)
+    for (column,) in cr.fetchall():
+        cr.execute(SQL(
+            "SELECT id, %s FROM monei_payment WHERE metadata IS NULL AND %s IS NOT NULL ORDER BY id",
+            SQL.identifier(column), SQL.identifier(column),
+        ))
+        for rows in split_every(BATCH_SIZE, cr.fetchall(), list):
+            values = []
+            for payment_id, text in rows:
+                try:
+                    values.append((payment_id, json.dumps(convert_metadata(json.loads(text)))))
+                except ValueError:
+                    continue
+            if values:
+                cr.execute(SQL(
+                    "UPDATE monei_payment SET metadata = v.metadata FROM (VALUES %s) AS v(id, metadata) WHERE monei_payment.id = v.id",
+                    SQL(', ').join(SQL('(%s, %s::jsonb)', payment_id, value) for payment_id, value in values),
+                ))
+        cr.execute(SQL('ALTER TABLE monei_payment DROP COLUMN %s', SQL.identifier(column)))
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    for link, model_name in DETAIL_MODELS:
+        _move_details(env, link, model_name)
+    _convert_metadata(env)
+    env['monei.payment'].invalidate_model()
+    # The daily summaries are kept per account and mode
+    env['monei.payment.daily']._rebuild()
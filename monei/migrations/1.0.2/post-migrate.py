@@ -0,0 +1,61 @@
+from odoo import SUPERUSER_ID, api
+from odoo.tools import SQL
+from odoo.tools.sql import column_exists
+
+
+def _link_stores(cr, column, name_column):
+    """Create the monei.store records of the old store columns and link the payments to them"""
+    name = SQL("COALESCE(NULLIF(%s, ''), %s)", SQL.identifier(name_column), SQL.identifier(column)) \
+        if name_column else SQL.identifier(column)
+    # The latest name of each store
+    cr.execute(SQL(
+        """
+        INSERT INTO monei_store (name, store_ref, company_id, create_uid, create_date, write_uid, write_date)
+             SELECT DISTINCT ON (company_id, %(column)s)
+                    %(name)s, %(column)s, company_id,
+                    1, now() at time zone 'UTC', 1, now() at time zone 'UTC'
+               FROM monei_payment
+              WHERE %(column)s IS NOT NULL AND %(column)s != '' AND company_id IS NOT NULL
+           ORDER BY company_id, %(column)s, write_date DESC NULLS LAST, id DESC
+        ON CONFLICT (store_ref, company_id) DO NOTHING
+        """,
+        column=SQL.identifier(column), name=name,
+    ))
+    cr.execute(SQL(
+        """
+        UPDATE monei_payment
+           SET store_id = monei_store.id
+          FROM monei_store
+         WHERE monei_payment.store_id IS NULL
+           AND monei_store.store_ref = monei_payment.%(column)s
+           AND monei_store.company_id = monei_payment.company_id
+        """,
+        column=SQL.identifier(column),
+    ))
+
+
+def migrate(cr, version):
+    """Link the payments to monei.store records
+
+    store_id used to hold the MONEI store ID and store_name its name. The
+    ORM renamed the old store_id column to store_id_moved<n> when it became
+    a many2one, store_name is now related to the store.
+    """
+    if not version:
+        return
+    cr.execute("""
+        SELECT column_name
+          FROM information_schema.columns
+         WHERE table_name = 'monei_payment' AND column_name LIKE 'store\\_id\\_moved%'
+      ORDER BY column_name
+    """)
+    columns = [column for (column,) in cr.fetchall()]
+    name_column = 'store_name' if column_exists(cr, 'monei_payment', 'store_name') else None
+    for column in columns:
+        _link_stores(cr, column, name_column)
+    for column in columns + ([name_column] if name_column else []):
+        cr.execute(SQL('ALTER TABLE monei_payment DROP COLUMN %s', SQL.identifier(column)))
+    if columns:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        env['monei.payment'].invalidate_model()
+        env['monei.payment.report']._refresh()
@@ -1,5 +1,11 @@
 from . import monei_mixin
 from . import monei_payment
+from . import monei_payment_details
+from . import monei_payment_report
+from . import monei_payment_daily
 from . import monei_settings
+from . import monei_store
+from . import monei_sync_run
 from . import payment_method
+from . import res_company
 from . import sale_order
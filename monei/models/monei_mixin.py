@@ -59,6 +59,10 @@ class MoneiMixin(models.AbstractModel):
         caller = self._get_caller()
         _logger.error(f"{caller} - {message}")
 
+    def _is_debug_enabled(self):
+        """Whether debug messages are logged, to skip building them otherwise"""
+        return _logger.isEnabledFor(logging.DEBUG)
+
     def _log_debug(self, message):
         """Log debug message with caller information"""
         caller = self._get_caller()
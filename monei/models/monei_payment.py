@@ -1,14 +1,85 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
+from odoo.tools import SQL, ormcache
+from odoo.tools.sql import create_index
+import hashlib
 import json
 import logging
-from ..graphql.queries import STORES_QUERY, CHARGES_QUERY
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from functools import lru_cache, partial
+from ..graphql.queries import CHARGES_QUERY, CHARGES_CORE_QUERY, CHARGE_DETAILS_QUERY, CHARGE_QUERY, ACCOUNT_QUERY
+from ..services import json_codec, streaming
 from ..services.api_service import MoneiAPIService
-from markupsafe import Markup
+from ..services.charges_pager import ChargesPager, PageSizer
+from ..services.charge_mapping import CHARGE_CORE_MAPPING, CHARGE_DETAIL_MAPPING
+from ..utils.profiling import get_current_session, profiled
+from markupsafe import Markup, escape
+from psycopg2.errors import ReadOnlySqlTransaction
 from ..graphql.mutations import CANCEL_PAYMENT_MUTATION, REFUND_PAYMENT_MUTATION, CAPTURE_PAYMENT_MUTATION
 
 _logger = logging.getLogger(__name__)
 
+PAYMENT_METHOD_ICON_PATH = '/monei/static/src/img/payment_methods'
+
+# Charges fetched by the first API call of a sync, default bounds of the
+# following ones and their target duration in seconds
+CHARGES_PAGE_SIZE = 1000
+CHARGES_PAGE_SIZE_MIN = 100
+CHARGES_PAGE_SIZE_MAX = 1000
+CHARGES_PAGE_SECONDS = 10.0
+
+# Charges processed at once when pages are streamed
+STREAM_CHUNK_SIZE = 200
+
+# Bump when the conversion of charges to payments changes, so that the next
+# sync rewrites every payment once
+PAYLOAD_HASH_VERSION = b'2'
+
+
+@lru_cache(maxsize=1024)
+def _render_payment_method_display(method, brand, last4, tokenization_method):
+    """Render the payment method HTML fragment
+
+    The fragment only depends on these four values, so it is memoized and
+    shared by every payment with the same method, brand and last digits.
+    """
+    icon_path = PAYMENT_METHOD_ICON_PATH
+
+    # Build icons HTML
+    icons_html = ''
+
+    # Add tokenization method icon if exists
+    if tokenization_method:
+        icons_html += f'<img src="{icon_path}/{escape(tokenization_method.lower())}.svg" class="payment-method-icon"/>'
+
+    # Add payment method/card brand icon
+    if not method:
+        # Handle empty payment method
+        text_html = ''
+    elif method == 'card':
+        brand = brand or 'default'
+        icons_html += f'<img src="{icon_path}/{escape(brand.lower())}.svg" class="payment-method-icon"/>'
+
+        # Only show last4 for cards
+        last4 = last4 or '****'
+        text_html = f'<span>•••• {escape(last4)}</span>'
+    else:
+        icons_html += f'<img src="{icon_path}/{escape(method.lower())}.svg" class="payment-method-icon"/>'
+        text_html = ''  # No text for non-card methods
+
+    # Combine icons and text
+    return Markup(
+        f'<div class="d-flex align-items-center">'
+        f'{icons_html}'
+        f'{text_html}'
+        f'</div>'
+    )
+
+
 class MoneiPayment(models.Model):
     _name = 'monei.payment'
     _inherit = ['monei.mixin']
@@ -17,8 +88,8 @@ class MoneiPayment(models.Model):
     _rec_name = 'name'
 
     # Basic Information
-    name = fields.Char(string='Payment ID', required=True, readonly=True)
-    order_id = fields.Char(string='Order ID', readonly=True)
+    name = fields.Char(string='Payment ID', required=True, readonly=True, index=True)
+    order_id = fields.Char(string='Order ID', readonly=True, index=True)
     checkout_id = fields.Char(string='Checkout ID', readonly=True)
     authorization_code = fields.Char(string='Authorization Code', readonly=True)
     livemode = fields.Boolean(string='Live Mode', readonly=True)
@@ -59,7 +130,7 @@ class MoneiPayment(models.Model):
         ('PARTIALLY_REFUNDED', 'Partially Refunded'),
         ('AUTHORIZED', 'Authorized'),
         ('EXPIRED', 'Expired'),
-    ], string='Status', readonly=True)
+    ], string='Status', readonly=True, index=True)
     status_code = fields.Char(string='Status Code', readonly=True)
     status_message = fields.Text(string='Status Message', readonly=True)
     cancellation_reason = fields.Selection([
@@ -76,8 +147,18 @@ class MoneiPayment(models.Model):
 
     # IDs and References
     account_id = fields.Char(string='Account ID', readonly=True)
-    store_id = fields.Char(string='Store ID', readonly=True)
-    store_name = fields.Char(string='Store Name', readonly=True)
+    company_id = fields.Many2one(
+        'res.company', string='Company', required=True, readonly=True, index=True,
+        default=lambda self: self.env.company,
+    )
+    is_active_account = fields.Boolean(
+        string='Active Account',
+        compute='_compute_is_active_account',
+        search='_search_is_active_account',
+        help='Payment of the MONEI account and mode (live or test) of the API key in use'
+    )
+    store_id = fields.Many2one('monei.store', string='Store', readonly=True, index='btree_not_null', ondelete='set null')
+    store_name = fields.Char(string='Store Name', related='store_id.name')
     subscription_id = fields.Char(string='Subscription ID', readonly=True)
     terminal_id = fields.Char(string='Terminal ID', readonly=True)
     provider_id = fields.Char(string='Provider ID', readonly=True)
@@ -91,8 +172,8 @@ class MoneiPayment(models.Model):
     descriptor = fields.Char(string='Descriptor', readonly=True)
 
     # Customer Information
-    customer_name = fields.Char(string='Customer Name', readonly=True)
-    customer_email = fields.Char(string='Customer Email', readonly=True)
+    customer_name = fields.Char(string='Customer Name', readonly=True, index='trigram')
+    customer_email = fields.Char(string='Customer Email', readonly=True, index='trigram')
     customer_phone = fields.Char(string='Customer Phone', readonly=True)
 
     # Payment Method
@@ -115,77 +196,101 @@ class MoneiPayment(models.Model):
     shop_country = fields.Char(string='Shop Country', readonly=True)
 
     # Shipping Details
-    shipping_name = fields.Char(string='Shipping Name', readonly=True)
-    shipping_email = fields.Char(string='Shipping Email', readonly=True)
-    shipping_phone = fields.Char(string='Shipping Phone', readonly=True)
-    shipping_company = fields.Char(string='Shipping Company', readonly=True)
-    shipping_tax_id = fields.Char(string='Shipping Tax ID', readonly=True)
+    shipping_name = fields.Char(related='address_id.shipping_name')
+    shipping_email = fields.Char(related='address_id.shipping_email')
+    shipping_phone = fields.Char(related='address_id.shipping_phone')
+    shipping_company = fields.Char(related='address_id.shipping_company')
+    shipping_tax_id = fields.Char(related='address_id.shipping_tax_id')
     
     # Shipping Address
-    shipping_street = fields.Char(string='Shipping Street', readonly=True)
-    shipping_street2 = fields.Char(string='Shipping Street 2', readonly=True)
-    shipping_city = fields.Char(string='Shipping City', readonly=True)
-    shipping_state = fields.Char(string='Shipping State', readonly=True)
-    shipping_zip = fields.Char(string='Shipping ZIP', readonly=True)
-    shipping_country = fields.Char(string='Shipping Country', readonly=True)
+    shipping_street = fields.Char(related='address_id.shipping_street')
+    shipping_street2 = fields.Char(related='address_id.shipping_street2')
+    shipping_city = fields.Char(related='address_id.shipping_city')
+    shipping_state = fields.Char(related='address_id.shipping_state')
+    shipping_zip = fields.Char(related='address_id.shipping_zip')
+    shipping_country = fields.Char(related='address_id.shipping_country')
 
     # Billing Details
-    billing_name = fields.Char(string='Billing Name', readonly=True)
-    billing_email = fields.Char(string='Billing Email', readonly=True)
-    billing_phone = fields.Char(string='Billing Phone', readonly=True)
-    billing_company = fields.Char(string='Billing Company', readonly=True)
-    billing_tax_id = fields.Char(string='Billing Tax ID', readonly=True)
+    billing_name = fields.Char(related='address_id.billing_name')
+    billing_email = fields.Char(related='address_id.billing_email')
+    billing_phone = fields.Char(related='address_id.billing_phone')
+    billing_company = fields.Char(related='address_id.billing_company')
+    billing_tax_id = fields.Char(related='address_id.billing_tax_id')
     
     # Billing Address
-    billing_street = fields.Char(string='Billing Street', readonly=True)
-    billing_street2 = fields.Char(string='Billing Street 2', readonly=True)
-    billing_city = fields.Char(string='Billing City', readonly=True)
-    billing_state = fields.Char(string='Billing State', readonly=True)
-    billing_zip = fields.Char(string='Billing ZIP', readonly=True)
-    billing_country = fields.Char(string='Billing Country', readonly=True)
+    billing_street = fields.Char(related='address_id.billing_street')
+    billing_street2 = fields.Char(related='address_id.billing_street2')
+    billing_city = fields.Char(related='address_id.billing_city')
+    billing_state = fields.Char(related='address_id.billing_state')
+    billing_zip = fields.Char(related='address_id.billing_zip')
+    billing_country = fields.Char(related='address_id.billing_country')
     
     # Billing Plan
     billing_plan = fields.Char(string='Billing Plan', readonly=True)
     
     # Session Details
-    session_ip = fields.Char(string='Session IP', readonly=True)
-    session_user_agent = fields.Char(string='Session User Agent', readonly=True)
-    session_country = fields.Char(string='Session Country', readonly=True)
-    session_lang = fields.Char(string='Session Language', readonly=True)
-    session_device_type = fields.Char(string='Session Device Type', readonly=True)
-    session_device_model = fields.Char(string='Session Device Model', readonly=True)
-    session_browser = fields.Char(string='Session Browser', readonly=True)
-    session_browser_version = fields.Char(string='Session Browser Version', readonly=True)
-    session_browser_accept = fields.Char(string='Session Browser Accept', readonly=True)
-    session_browser_color_depth = fields.Integer(string='Session Browser Color Depth', readonly=True)
-    session_browser_screen_height = fields.Integer(string='Session Browser Screen Height', readonly=True)
-    session_browser_screen_width = fields.Integer(string='Session Browser Screen Width', readonly=True)
-    session_browser_timezone_offset = fields.Integer(string='Session Browser Timezone Offset', readonly=True)
-    session_os = fields.Char(string='Session OS', readonly=True)
-    session_os_version = fields.Char(string='Session OS Version', readonly=True)
-    session_source = fields.Char(string='Session Source', readonly=True)
-    session_source_version = fields.Char(string='Session Source Version', readonly=True)
+    session_ip = fields.Char(related='session_detail_id.session_ip')
+    session_user_agent = fields.Char(related='session_detail_id.session_user_agent')
+    session_country = fields.Char(related='session_detail_id.session_country')
+    session_lang = fields.Char(related='session_detail_id.session_lang')
+    session_device_type = fields.Char(related='session_detail_id.session_device_type')
+    session_device_model = fields.Char(related='session_detail_id.session_device_model')
+    session_browser = fields.Char(related='session_detail_id.session_browser')
+    session_browser_version = fields.Char(related='session_detail_id.session_browser_version')
+    session_browser_accept = fields.Char(related='session_detail_id.session_browser_accept')
+    session_browser_color_depth = fields.Integer(related='session_detail_id.session_browser_color_depth')
+    session_browser_screen_height = fields.Integer(related='session_detail_id.session_browser_screen_height')
+    session_browser_screen_width = fields.Integer(related='session_detail_id.session_browser_screen_width')
+    session_browser_timezone_offset = fields.Integer(related='session_detail_id.session_browser_timezone_offset')
+    session_os = fields.Char(related='session_detail_id.session_os')
+    session_os_version = fields.Char(related='session_detail_id.session_os_version')
+    session_source = fields.Char(related='session_detail_id.session_source')
+    session_source_version = fields.Char(related='session_detail_id.session_source_version')
 
     # Trace Details
-    trace_ip = fields.Char(string='Trace IP', readonly=True)
-    trace_user_agent = fields.Char(string='Trace User Agent', readonly=True)
-    trace_country = fields.Char(string='Trace Country', readonly=True)
-    trace_lang = fields.Char(string='Trace Language', readonly=True)
-    trace_device_type = fields.Char(string='Trace Device Type', readonly=True)
-    trace_device_model = fields.Char(string='Trace Device Model', readonly=True)
-    trace_browser = fields.Char(string='Trace Browser', readonly=True)
-    trace_browser_version = fields.Char(string='Trace Browser Version', readonly=True)
-    trace_browser_accept = fields.Char(string='Trace Browser Accept', readonly=True)
-    trace_os = fields.Char(string='Trace OS', readonly=True)
-    trace_os_version = fields.Char(string='Trace OS Version', readonly=True)
-    trace_source = fields.Char(string='Trace Source', readonly=True)
-    trace_source_version = fields.Char(string='Trace Source Version', readonly=True)
-    trace_user_id = fields.Char(string='Trace User ID', readonly=True)
-    trace_user_email = fields.Char(string='Trace User Email', readonly=True)
-    trace_user_name = fields.Char(string='Trace User Name', readonly=True)
+    trace_ip = fields.Char(related='session_detail_id.trace_ip')
+    trace_user_agent = fields.Char(related='session_detail_id.trace_user_agent')
+    trace_country = fields.Char(related='session_detail_id.trace_country')
+    trace_lang = fields.Char(related='session_detail_id.trace_lang')
+    trace_device_type = fields.Char(related='session_detail_id.trace_device_type')
+    trace_device_model = fields.Char(related='session_detail_id.trace_device_model')
+    trace_browser = fields.Char(related='session_detail_id.trace_browser')
+    trace_browser_version = fields.Char(related='session_detail_id.trace_browser_version')
+    trace_browser_accept = fields.Char(related='session_detail_id.trace_browser_accept')
+    trace_os = fields.Char(related='session_detail_id.trace_os')
+    trace_os_version = fields.Char(related='session_detail_id.trace_os_version')
+    trace_source = fields.Char(related='session_detail_id.trace_source')
+    trace_source_version = fields.Char(related='session_detail_id.trace_source_version')
+    trace_user_id = fields.Char(related='session_detail_id.trace_user_id')
+    trace_user_email = fields.Char(related='session_detail_id.trace_user_email')
+    trace_user_name = fields.Char(related='session_detail_id.trace_user_name')
 
     # Metadata
-    metadata = fields.Text(string='Metadata', readonly=True)
+    metadata = fields.Json(string='Metadata', readonly=True)
+    metadata_display = fields.Text(
+        string='Metadata',
+        compute='_compute_metadata_display',
+        readonly=True
+    )
+    metadata_search = fields.Char(
+        string='Metadata Key',
+        compute='_compute_metadata_display',
+        search='_search_metadata',
+        help='Search payments by metadata, either "key" or "key=value"'
+    )
+    details_loaded = fields.Boolean(
+        string='Details Loaded',
+        default=True,
+        readonly=True,
+        help='False when the payment was synced in lazy details mode and its '
+             'session, trace and metadata details have not been fetched yet'
+    )
+    payload_hash = fields.Char(
+        string='Payload Hash',
+        readonly=True,
+        copy=False,
+        help='Hash of the charge as last synced, unchanged charges are skipped by the sync'
+    )
 
     # Additional Payment Method Fields
     payment_method_type = fields.Selection([
@@ -199,30 +304,50 @@ class MoneiPayment(models.Model):
         ('sepa', 'SEPA'),
         ('klarna', 'Klarna'),
         ('mbway', 'MB WAY')
-    ], string='Payment Method Type', readonly=True)
+    ], string='Payment Method Type', readonly=True, index=True)
     
     # PayPal specific fields
-    paypal_order_id = fields.Char(string='PayPal Order ID', readonly=True)
-    paypal_payer_id = fields.Char(string='PayPal Payer ID', readonly=True)
-    paypal_email = fields.Char(string='PayPal Email', readonly=True)
-    paypal_name = fields.Char(string='PayPal Name', readonly=True)
+    paypal_order_id = fields.Char(related='method_detail_id.paypal_order_id')
+    paypal_payer_id = fields.Char(related='method_detail_id.paypal_payer_id')
+    paypal_email = fields.Char(related='method_detail_id.paypal_email')
+    paypal_name = fields.Char(related='method_detail_id.paypal_name')
 
     # Bizum specific fields
     bizum_phone = fields.Char(string='Bizum Phone', readonly=True)
     bizum_integration_type = fields.Char(string='Bizum Integration Type', readonly=True)
 
     # SEPA specific fields
-    sepa_accountholder_name = fields.Char(string='SEPA Account Holder Name', readonly=True)
-    sepa_accountholder_email = fields.Char(string='SEPA Account Holder Email', readonly=True)
-    sepa_country_code = fields.Char(string='SEPA Country Code', readonly=True)
-    sepa_bank_name = fields.Char(string='SEPA Bank Name', readonly=True)
-    sepa_bank_code = fields.Char(string='SEPA Bank Code', readonly=True)
-    sepa_bic = fields.Char(string='SEPA BIC', readonly=True)
-    sepa_last4 = fields.Char(string='SEPA Last 4', readonly=True)
+    sepa_accountholder_name = fields.Char(related='method_detail_id.sepa_accountholder_name')
+    sepa_accountholder_email = fields.Char(related='method_detail_id.sepa_accountholder_email')
+    sepa_country_code = fields.Char(related='method_detail_id.sepa_country_code')
+    sepa_bank_name = fields.Char(related='method_detail_id.sepa_bank_name')
+    sepa_bank_code = fields.Char(related='method_detail_id.sepa_bank_code')
+    sepa_bic = fields.Char(related='method_detail_id.sepa_bic')
+    sepa_last4 = fields.Char(related='method_detail_id.sepa_last4')
 
     # Klarna specific fields
-    klarna_billing_category = fields.Char(string='Klarna Billing Category', readonly=True)
-    klarna_auth_payment_method = fields.Char(string='Klarna Auth Payment Method', readonly=True)
+    klarna_billing_category = fields.Char(related='method_detail_id.klarna_billing_category')
+    klarna_auth_payment_method = fields.Char(related='method_detail_id.klarna_auth_payment_method')
+
+    # Detail blocks stored in companion tables
+    address_id = fields.Many2one(
+        'monei.payment.address',
+        string='Address Details',
+        readonly=True,
+        copy=False
+    )
+    session_detail_id = fields.Many2one(
+        'monei.payment.session',
+        string='Session Details',
+        readonly=True,
+        copy=False
+    )
+    method_detail_id = fields.Many2one(
+        'monei.payment.method.detail',
+        string='Payment Method Details',
+        readonly=True,
+        copy=False
+    )
 
     # Computed Fields
     customer_display = fields.Char(
@@ -235,7 +360,8 @@ class MoneiPayment(models.Model):
     payment_method_display = fields.Html(
         string='Payment Method',
         compute='_compute_payment_method_display',
-        store=False,
+        store=True,
+        sanitize=False,
         readonly=True
     )
 
@@ -299,17 +425,97 @@ class MoneiPayment(models.Model):
         help='Link to view the payment in MONEI Dashboard'
     )
 
-    @api.model
-    def create(self, vals):
-        """Override to auto-link with sale order and sync information"""
-        res = super().create(vals)
-        if res.order_id:
-            sale_order = self.env['sale.order'].search([
-                ('name', '=', res.order_id)
-            ], limit=1)
-            if sale_order:
-                res.sale_order_id = sale_order.id
-                res._sync_order_information(sale_order)
+    # Companion many2one -> model holding the detail block
+    _detail_models = {
+        'address_id': 'monei.payment.address',
+        'session_detail_id': 'monei.payment.session',
+        'method_detail_id': 'monei.payment.method.detail',
+    }
+
+    # Fields feeding the monei.payment.daily summary
+    _daily_fields = ('payment_date', 'company_id', 'account_id', 'livemode', 'status', 'amount', 'refunded_amount')
+
+    def _get_daily_rows(self):
+        """Values of the payments as seen by the daily summary"""
+        return [
+            (record.payment_date, record.company_id.id, record.account_id, record.livemode,
+             record.status, record.amount, record.refunded_amount)
+            for record in self
+        ]
+
+    def _split_detail_vals(self, vals):
+        """Pop the companion fields out of vals, grouped by companion many2one"""
+        details = {}
+        for link_field, model_name in self._detail_models.items():
+            model_fields = self.env[model_name]._fields
+            block = {
+                fname: vals.pop(fname)
+                for fname in list(vals)
+                if fname in model_fields and not model_fields[fname].automatic
+            }
+            if block:
+                details[link_field] = block
+        return details
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override to store detail blocks in their companion tables and
+        auto-link with sale order and sync information"""
+        vals_list = [dict(vals) for vals in vals_list]
+        details_list = [self._split_detail_vals(vals) for vals in vals_list]
+        for link_field, model_name in self._detail_models.items():
+            pending = []
+            for vals, details in zip(vals_list, details_list):
+                block = details.get(link_field)
+                # Only create a companion row when there is something to store
+                if block and any(block.values()):
+                    pending.append((vals, block))
+            if pending:
+                companions = self.env[model_name].create([block for _vals, block in pending])
+                for (vals, _block), companion in zip(pending, companions):
+                    vals[link_field] = companion.id
+
+        records = super().create(vals_list)
+        self.env['monei.payment.daily']._apply_deltas(added=records._get_daily_rows())
+        for res in records:
+            if res.order_id:
+                sale_order = self.env['sale.order'].search([
+                    ('name', '=', res.order_id)
+                ], limit=1)
+                if sale_order:
+                    res.sale_order_id = sale_order.id
+                    res._sync_order_information(sale_order)
+        return records
+
+    def write(self, vals):
+        """Override to route detail fields to their companion tables"""
+        vals = dict(vals)
+        details = self._split_detail_vals(vals)
+        daily_before = self._get_daily_rows() if set(self._daily_fields).intersection(vals) else None
+        res = super().write(vals) if vals else True
+        if daily_before is not None:
+            self.env['monei.payment.daily']._apply_deltas(
+                added=self._get_daily_rows(), removed=daily_before
+            )
+        for link_field, block in details.items():
+            companions = self.mapped(link_field)
+            if companions:
+                companions.write(block)
+            missing = self.filtered(lambda record: not record[link_field])
+            if missing and any(block.values()):
+                model = self.env[self._detail_models[link_field]]
+                for record, companion in zip(missing, model.create([block] * len(missing))):
+                    super(MoneiPayment, record).write({link_field: companion.id})
+        return res
+
+    def unlink(self):
+        """Override to remove the companion rows along with the payments"""
+        companions = [self.mapped(link_field) for link_field in self._detail_models]
+        daily_rows = self._get_daily_rows()
+        res = super().unlink()
+        self.env['monei.payment.daily']._apply_deltas(removed=daily_rows)
+        for records in companions:
+            records.unlink()
         return res
 
     @api.depends('payment_method', 'customer_phone', 'bizum_phone', 'customer_email', 
@@ -329,39 +535,100 @@ class MoneiPayment(models.Model):
     @api.depends('payment_method', 'card_brand', 'card_last4', 'tokenization_method')
     def _compute_payment_method_display(self):
         for record in self:
-            icon_path = '/monei/static/src/img/payment_methods'
-            
-            # Build icons HTML
-            icons_html = ''
-            
-            # Add tokenization method icon if exists
-            if record.tokenization_method:
-                icons_html += f'<img src="{icon_path}/{record.tokenization_method.lower()}.svg" class="payment-method-icon"/>'
-            
-            # Add payment method/card brand icon
-            if not record.payment_method:
-                # Handle empty payment method
-                icons_html += ''
-                text_html = ''
-            elif record.payment_method == 'card':
-                brand = record.card_brand or 'default'
-                icons_html += f'<img src="{icon_path}/{brand.lower()}.svg" class="payment-method-icon"/>'
-                
-                # Only show last4 for cards
-                last4 = record.card_last4 or '****'
-                text_html = f'<span>•••• {last4}</span>'
-            else:
-                method = record.payment_method or 'unknown'
-                icons_html += f'<img src="{icon_path}/{method.lower()}.svg" class="payment-method-icon"/>'
-                text_html = ''  # No text for non-card methods
-            
-            # Combine icons and text
-            record.payment_method_display = Markup(
-                f'<div class="d-flex align-items-center">'
-                f'{icons_html}'
-                f'{text_html}'
-                f'</div>'
+            record.payment_method_display = _render_payment_method_display(
+                record.payment_method,
+                record.card_brand,
+                record.card_last4,
+                record.tokenization_method,
+            )
+
+    @api.depends('metadata')
+    def _compute_metadata_display(self):
+        for record in self:
+            record.metadata_display = '\n'.join(
+                f'{key}: {value}' for key, value in (record.metadata or {}).items()
             )
+            record.metadata_search = False
+
+    def _search_metadata(self, operator, value):
+        """Search on the metadata jsonb column, using its GIN index
+
+        "key" matches payments having that metadata key, "key=value" the ones
+        where the key has exactly that value.
+        """
+        if operator not in ('=', 'ilike', '!=', 'not ilike') or not isinstance(value, str):
+            raise UserError(_('Unsupported metadata search: %s %s') % (operator, value))
+        key, sep, key_value = value.partition('=')
+        key = key.strip()
+        metadata = SQL.identifier(self._table, 'metadata')
+        if sep:
+            condition = SQL('%s @> %s::jsonb', metadata, json.dumps({key: key_value.strip()}))
+        else:
+            condition = SQL('%s ? %s', metadata, key)
+        query = self._search([])
+        query.add_where(condition)
+        in_operator = 'not in' if operator in ('!=', 'not ilike') else 'in'
+        return [('id', in_operator, query)]
+
+    @api.model
+    @ormcache('api_key')
+    def _fetch_account_id(self, api_key):
+        """MONEI account id of an API key, cached per registry
+
+        Raises instead of returning an empty id, so that a failed lookup is
+        not cached and is tried again the next time.
+        """
+        response = MoneiAPIService(self.env).execute_query(ACCOUNT_QUERY)
+        account_id = self._safe_get(response, 'data', 'account', 'id')
+        if not account_id:
+            raise UserError(_('The MONEI account of the API key could not be found'))
+        return account_id
+
+    @api.model
+    def _get_active_account(self):
+        """Return the (account id, livemode) of the current company's API key
+
+        The account id is None when it cannot be fetched, and the result is
+        None when no API key is configured.
+        """
+        try:
+            api_key = MoneiAPIService(self.env)._get_api_key()
+        except UserError:
+            return None
+        account_id = None
+        try:
+            account_id = self._fetch_account_id(api_key)
+        except Exception as e:
+            self._log_warning(f'Could not fetch the MONEI account of the API key: {e}')
+        return account_id, api_key.startswith('pk_live_')
+
+    @api.model
+    def _get_active_account_domain(self):
+        """Domain of the payments of the active account"""
+        active_account = self._get_active_account()
+        if not active_account:
+            return []
+        account_id, livemode = active_account
+        domain = [('livemode', '=', livemode)]
+        if account_id:
+            domain.append(('account_id', '=', account_id))
+        return domain
+
+    @api.depends('account_id', 'livemode')
+    def _compute_is_active_account(self):
+        active_payments = self.filtered_domain(self._get_active_account_domain())
+        for record in self:
+            record.is_active_account = record in active_payments
+
+    def _search_is_active_account(self, operator, value):
+        if operator not in ('=', '!=') or not isinstance(value, bool):
+            raise UserError(_('Operation not supported'))
+        domain = self._get_active_account_domain()
+        if not domain:
+            return [] if (operator == '=') == value else [('id', '=', False)]
+        if (operator == '=') == value:
+            return domain
+        return ['!'] + ['&'] * (len(domain) - 1) + domain
 
     @api.depends('cancellation_reason')
     def _compute_cancellation_reason_display(self):
@@ -375,16 +642,144 @@ class MoneiPayment(models.Model):
         for record in self:
             record.last_refund_reason_display = refund_selection.get(record.last_refund_reason, '')
 
+    def init(self):
+        super().init()
+        # Composite index matching _order, used by every list view
+        create_index(
+            self.env.cr,
+            'monei_payment_payment_date_id_index',
+            self._table,
+            ['payment_date DESC', 'id DESC'],
+        )
+        # GIN index for the metadata key and key/value lookups
+        create_index(
+            self.env.cr,
+            'monei_payment_metadata_gin_index',
+            self._table,
+            ['metadata'],
+            method='gin',
+        )
+
     @api.model
+    def _get_index_usage(self):
+        """Return the usage statistics of the indexes of the payments table
+
+        Returns:
+            list: dicts with the index name, its size and how many times
+                  PostgreSQL used it since the statistics were last reset
+        """
+        self.env.cr.execute(SQL(
+            """
+            SELECT indexrelname AS index_name,
+                   idx_scan AS scans,
+                   idx_tup_read AS tuples_read,
+                   pg_size_pretty(pg_relation_size(indexrelid)) AS size
+              FROM pg_stat_user_indexes
+             WHERE relname = %s
+          ORDER BY indexrelname
+            """,
+            self._table,
+        ))
+        return self.env.cr.dictfetchall()
+
+    @api.model
+    def _explain_search(self, domain=None, limit=80):
+        """Return the PostgreSQL plan of a list view search
+
+        Useful to check that list and search view queries hit the indexes,
+        e.g. ``env['monei.payment']._explain_search([('customer_email', 'ilike', 'john')])``
+        """
+        query = self._search(domain or [], limit=limit, order=self._order)
+        self.env.cr.execute(SQL('EXPLAIN %s', query.select()))
+        return '\n'.join(row[0] for row in self.env.cr.fetchall())
+
+    def _get_sync_lock_key(self, api_key):
+        """Advisory lock key of the MONEI account behind the API key"""
+        digest = hashlib.sha1(f'monei.sync:{api_key}'.encode()).digest()
+        return int.from_bytes(digest[:8], 'big', signed=True)
+
+    def _try_sync_lock(self, api_key):
+        """Take the account's sync lock until the end of the transaction
+
+        Returns:
+            bool: False if another transaction is syncing the same account
+        """
+        self.env.cr.execute(SQL('SELECT pg_try_advisory_xact_lock(%s)', self._get_sync_lock_key(api_key)))
+        return self.env.cr.fetchone()[0]
+
+    def _get_sync_lock_holder(self, api_key):
+        """PID of the PostgreSQL backend holding the account's sync lock, if any"""
+        lock_key = self._get_sync_lock_key(api_key)
+        # A bigint advisory lock is listed as its high and low 32 bits
+        self.env.cr.execute(SQL(
+            """
+            SELECT pid
+              FROM pg_locks
+             WHERE locktype = 'advisory' AND granted
+               AND classid = %s AND objid = %s AND objsubid = 1
+            """,
+            (lock_key >> 32) & 0xFFFFFFFF, lock_key & 0xFFFFFFFF,
+        ))
+        row = self.env.cr.fetchone()
+        return row and row[0]
+
+    def _sync_in_progress_action(self, api_key):
+        """Notification with the progress of the sync holding the lock"""
+        run = self.env['monei.sync.run']._get_running(self._get_sync_lock_holder(api_key))
+        if run:
+            message = _('A synchronization started at %s is already running: %d pages and %d payments processed so far.') % (
+                fields.Datetime.to_string(run.start_date), run.pages_fetched, run.rows_processed,
+            )
+        else:
+            message = _('A synchronization is already running.')
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'warning',
+                'title': _('Synchronization in Progress'),
+                'message': message,
+                'fadeout': 'slow',
+                'next': {
+                    'type': 'ir.actions.act_window_close',
+                }
+            },
+        }
+
+    @api.model
+    @profiled('sync_payments')
     def action_sync_payments(self, date_from=None, date_to=None):
         api_service = MoneiAPIService(self.env)
+        # Overlapping syncs of the same account would fetch the same pages and
+        # race on the inserts and deletes, join the running one instead
+        if not self._try_sync_lock(api_service._get_api_key()):
+            self._log_info('Payment sync skipped, another sync of the account is running')
+            return self._sync_in_progress_action(api_service._get_api_key())
         self._log_info('Syncing payments from MONEI API')
+        lazy_details = self._is_lazy_details_enabled()
+        charges_query = CHARGES_CORE_QUERY if lazy_details else CHARGES_QUERY
+
+        SyncRun = self.env['monei.sync.run']
+        run_id = SyncRun._start({
+            'mode': 'lazy' if lazy_details else 'full',
+            'date_from': date_from,
+            'date_to': date_to,
+        })
+        profile_session = get_current_session()
+        if profile_session:
+            profile_session.sync_run_id = run_id
+        run_totals = {
+            'pages_fetched': 0,
+            'rows_processed': 0,
+            'api_duration': 0.0,
+            'processing_duration': 0.0,
+            'query_count': 0,
+        }
+        sync_start = time.perf_counter()
 
         try:
-            # Get stores data once at the beginning
-            stores_response = api_service.execute_query(STORES_QUERY)
-            stores = stores_response['data']['stores'].get('items', []) or []
-            stores_by_id = {store['id']: store['name'] for store in stores}
+            # Store directory, fetched from the API only once its TTL expired
+            store_ids = self.env['monei.store']._get_store_ids(api_service)
 
             # Initialize counters for total operation
             total_added = 0
@@ -394,73 +789,111 @@ class MoneiPayment(models.Model):
             
             # Keep track of all payment IDs from API
             synced_payment_ids = set()
-            
-            def sync_batch(start_from=0):
-                nonlocal total_added, total_updated, total_skipped
-                
-                # Build filter parts
-                filter_parts = []
-                
-                filter_parts.append(f'size: 1000')
-                
-                # Add from parameter
-                if start_from > 0:
-                    filter_parts.append(f'from: {start_from}')
-                
-                # Build createdAt filter if dates are provided
-                if date_from or date_to:
-                    filter_values = []
-                    if date_from:
-                        filter_values.append(str(int(date_from.timestamp())))
-                    if date_to:
-                        filter_values.append(str(int(date_to.timestamp())))
-                    if filter_values:
-                        filter_parts.append(f'filter: {{createdAt: {{range: [{", ".join(filter_values)}]}}}}')
-                
-                # Combine filter parts
-                filter_str = f'({", ".join(filter_parts)})' if filter_parts else ''
-                
-                query = CHARGES_QUERY % filter_str
-                response_data = api_service.execute_query(query)
-                
-                if 'data' in response_data:
-                    payments = response_data['data']['charges'].get('items', []) or []
-                    total_payments = response_data['data']['charges']['total']
-                    
-                    # Add payment IDs to synced set
-                    for payment in payments:
-                        if payment and isinstance(payment, dict):
-                            payment_id = payment.get('id')
-                            if payment_id:
-                                synced_payment_ids.add(payment_id)
-                    
-                    # Process current batch with stores data from closure
-                    added, updated, skipped = self._process_payment_batch(payments, stores_by_id)
-                    
+
+            # Large pages can be parsed while they download, their items are
+            # then processed in chunks as they arrive. The next pages are
+            # fetched in the background while the current one is processed.
+            pager = ChargesPager(
+                api_service,
+                partial(self._get_charges_query, charges_query, date_from=date_from, date_to=date_to),
+                self._get_page_sizer(),
+                prefetch=self._get_prefetch_pages(),
+                stream=self._is_page_streaming_enabled(),
+                chunk_size=STREAM_CHUNK_SIZE,
+                deadline=self._get_sync_deadline(),
+            )
+            with pager:
+                # Time waited for the page, the part of the API time not
+                # overlapped by the processing of the previous pages
+                page_start = time.perf_counter()
+                queries_before = self.env.cr.sql_log_count
+                for page in pager:
+                    added = updated = skipped = 0
+                    processing_duration = 0.0
+                    for payments in page:
+                        # Add payment IDs to synced set
+                        for payment in payments:
+                            if payment and isinstance(payment, dict):
+                                payment_id = payment.get('id')
+                                if payment_id:
+                                    synced_payment_ids.add(payment_id)
+
+                        processing_start = time.perf_counter()
+                        chunk_added, chunk_updated, chunk_skipped = self._process_payment_batch(
+                            payments, store_ids, lazy_details=lazy_details
+                        )
+                        # Flush so the page's database time is accounted to it
+                        self.env.flush_all()
+                        processing_duration += time.perf_counter() - processing_start
+                        added += chunk_added
+                        updated += chunk_updated
+                        skipped += chunk_skipped
+
+                    api_duration = time.perf_counter() - page_start - processing_duration
+                    query_count = self.env.cr.sql_log_count - queries_before
+
+                    run_totals['pages_fetched'] += 1
+                    run_totals['rows_processed'] += page.rows
+                    run_totals['api_duration'] += api_duration
+                    run_totals['processing_duration'] += processing_duration
+                    run_totals['query_count'] += query_count
                     total_added += added
                     total_updated += updated
                     total_skipped += skipped
-                    
-                    # If we got a full batch (1000 payments), there might be more
-                    if len(payments) == 1000 and (start_from + len(payments)) < total_payments:
-                        # Recursive call for next batch
-                        sync_batch(start_from + len(payments))
-            
-            # Start the sync process
-            sync_batch()
+                    SyncRun._log_page(run_id, {
+                        'sequence': run_totals['pages_fetched'],
+                        'offset': page.offset,
+                        'page_size': page.size,
+                        'rows': page.rows,
+                        'api_duration': api_duration,
+                        'processing_duration': processing_duration,
+                        'query_count': query_count,
+                        'rows_per_second': page.rows / processing_duration if processing_duration else 0.0,
+                    }, dict(
+                        run_totals,
+                        added_count=total_added,
+                        updated_count=total_updated,
+                        skipped_count=total_skipped,
+                    ))
+                    page_start = time.perf_counter()
+                    queries_before = self.env.cr.sql_log_count
             
-            # Find and delete payments that no longer exist in API
-            domain = [('name', 'not in', list(synced_payment_ids))]
-            if date_from:
-                domain.append(('payment_date', '>=', date_from))
-            if date_to:
-                domain.append(('payment_date', '<=', date_to))
+            active_account = self._get_active_account()
+            if pager.deadline_reached:
+                # Payments after the last page fetched were not seen, none
+                # can be told obsolete
+                self._log_warning(
+                    f'Payment sync stopped at its deadline after {run_totals["rows_processed"]} payments'
+                )
+            elif not active_account or not active_account[0]:
+                # Without the account id the payments of the other accounts
+                # in the same mode cannot be told apart
+                self._log_warning('MONEI account of the API key unknown, obsolete payments are not deleted')
+            else:
+                # Find and delete payments that no longer exist in API, payments
+                # of the other accounts or modes are kept
+                account_id, livemode = active_account
+                domain = [
+                    ('name', 'not in', list(synced_payment_ids)),
+                    ('company_id', '=', self.env.company.id),
+                    ('account_id', '=', account_id),
+                    ('livemode', '=', livemode),
+                ]
+                if date_from:
+                    domain.append(('payment_date', '>=', date_from))
+                if date_to:
+                    domain.append(('payment_date', '<=', date_to))
             
-            payments_to_delete = self.search(domain)
-            if payments_to_delete:
-                total_deleted = len(payments_to_delete)
-                self._log_info(f'Deleting {total_deleted} payments that no longer exist in MONEI')
-                payments_to_delete.unlink()
+                payments_to_delete = self.search(domain)
+                if payments_to_delete:
+                    total_deleted = len(payments_to_delete)
+                    self._log_info(f'Deleting {total_deleted} payments that no longer exist in MONEI')
+                    payments_to_delete.unlink()
+
+            # Keep the reporting aggregates in line with the synced payments,
+            # action_sync_all_accounts refreshes them once for all companies
+            if not self.env.context.get('monei_skip_report_refresh'):
+                self.env['monei.payment.report']._refresh()
             
             # Prepare result message
             message = []
@@ -472,10 +905,25 @@ class MoneiPayment(models.Model):
                 message.append(_('%d obsolete payments removed') % total_deleted)
             if total_skipped > 0:
                 message.append(_('%d payments unchanged') % total_skipped)
+            if pager.deadline_reached:
+                message.append(_('the sync time limit was reached, run it again to sync the remaining payments'))
             
             if not message:
                 message = [_('No changes found')]
 
+            duration = time.perf_counter() - sync_start
+            SyncRun._finish(run_id, dict(
+                run_totals,
+                state='done',
+                deadline_reached=pager.deadline_reached,
+                added_count=total_added,
+                updated_count=total_updated,
+                skipped_count=total_skipped,
+                deleted_count=total_deleted,
+                duration=duration,
+                rows_per_second=run_totals['rows_processed'] / duration if duration else 0.0,
+            ))
+
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -492,23 +940,231 @@ class MoneiPayment(models.Model):
 
         except Exception as e:
             self._log_error(f'Failed to sync payments: {e}')
+            SyncRun._finish(run_id, dict(
+                run_totals,
+                state='failed',
+                error=str(e),
+                duration=time.perf_counter() - sync_start,
+            ))
             raise UserError(_('Failed to sync payments: %s') % str(e))
 
-    def _process_payment_batch(self, payments, stores_by_id):
-        """Process a batch of payments and return counters"""
+    @api.model
+    def _get_charges_query(self, charges_query, start_from, size, date_from=None, date_to=None):
+        """Build the query of the charges page of size starting at start_from"""
+        filter_parts = [f'size: {size}']
+        if start_from > 0:
+            filter_parts.append(f'from: {start_from}')
+
+        # Build createdAt filter if dates are provided
+        if date_from or date_to:
+            filter_values = []
+            if date_from:
+                filter_values.append(str(int(date_from.timestamp())))
+            if date_to:
+                filter_values.append(str(int(date_to.timestamp())))
+            filter_parts.append(f'filter: {{createdAt: {{range: [{", ".join(filter_values)}]}}}}')
+
+        return charges_query % f'({", ".join(filter_parts)})'
+
+    @api.model
+    def _get_page_sizer(self):
+        """Page sizer within the monei.sync_page_size_min and monei.sync_page_size_max bounds"""
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        min_size = int(get_param('monei.sync_page_size_min') or CHARGES_PAGE_SIZE_MIN)
+        max_size = int(get_param('monei.sync_page_size_max') or CHARGES_PAGE_SIZE_MAX)
+        return PageSizer(CHARGES_PAGE_SIZE, min_size, max_size, CHARGES_PAGE_SECONDS)
+
+    @api.model
+    def _get_sync_deadline(self):
+        """time.monotonic() value at which the sync stops fetching pages, see monei.sync_deadline"""
+        seconds = int(self.env['ir.config_parameter'].sudo().get_param('monei.sync_deadline') or 0)
+        return time.monotonic() + seconds if seconds > 0 else None
+
+    @api.model
+    def _get_prefetch_pages(self):
+        """Number of charge pages fetched ahead of their processing, see monei.sync_prefetch_pages"""
+        return max(0, int(self.env['ir.config_parameter'].sudo().get_param('monei.sync_prefetch_pages', 2) or 0))
+
+    @api.model
+    def _is_page_streaming_enabled(self):
+        """Whether charge pages are parsed while they download, see monei.stream_pages"""
+        if not self.env['ir.config_parameter'].sudo().get_param('monei.stream_pages'):
+            return False
+        if not streaming.is_available():
+            self._log_warning('Streaming of payment pages needs the ijson package, reading whole pages instead')
+            return False
+        return True
+
+    @api.model
+    def _get_sync_companies(self):
+        """Companies with a MONEI API key, grouped by key
+
+        Companies sharing a key (e.g. the global one) each keep their own
+        payments, they are all synced but one after the other since the sync
+        lock is taken per account.
+        """
+        global_api_key = self.env['ir.config_parameter'].sudo().get_param('monei.api_key')
+        companies_by_key = defaultdict(list)
+        for company in self.env['res.company'].sudo().search([]):
+            api_key = company.monei_api_key or global_api_key
+            if api_key:
+                companies_by_key[api_key].append(company)
+        return list(companies_by_key.values())
+
+    @api.model
+    def action_sync_all_accounts(self, date_from=None, date_to=None):
+        """Sync the MONEI accounts of all companies in parallel
+
+        Every account is synced in its own thread, and every company in its
+        own transaction, so a slow or failing account neither delays nor rolls
+        back the others. The number of threads is set by the
+        monei.sync_workers system parameter. Companies whose account is
+        already being synced are skipped. The reporting aggregates are
+        refreshed once, after all companies.
+        """
+        company_groups = self._get_sync_companies()
+        if not company_groups:
+            raise UserError(_('Please configure MONEI API Key first'))
+        workers = int(self.env['ir.config_parameter'].sudo().get_param('monei.sync_workers', 4) or 1)
+        registry, uid, context = self.env.registry, self.env.uid, dict(self.env.context)
+
+        def sync_company(company_id):
+            """Sync a company, False if its account is being synced elsewhere"""
+            # Database context of the logs, like the cron and HTTP threads
+            thread = threading.current_thread()
+            thread.dbname = registry.db_name
+            thread.uid = uid
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, dict(
+                    context, allowed_company_ids=[company_id], monei_skip_report_refresh=True,
+                ), su=True)
+                Payment = env['monei.payment']
+                if not Payment._try_sync_lock(MoneiAPIService(env)._get_api_key()):
+                    return False
+                Payment.action_sync_payments(date_from=date_from, date_to=date_to)
+                return True
+
+        def sync_companies(companies):
+            """Sync the companies of an account one after the other"""
+            results = {}
+            for company in companies:
+                try:
+                    results[company] = sync_company(company.id)
+                except Exception as e:
+                    self._log_error(f'Failed to sync MONEI payments of {company.name}: {e}')
+                    results[company] = None
+            return results
+
+        synced, skipped, failed = [], [], []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(company_groups)))) as executor:
+            futures = [executor.submit(sync_companies, companies) for companies in company_groups]
+            for future in as_completed(futures):
+                for company, result in future.result().items():
+                    if result is None:
+                        failed.append(company.name)
+                    elif result:
+                        synced.append(company.name)
+                    else:
+                        self._log_info(f'MONEI payments of {company.name} skipped, a sync of the account is running')
+                        skipped.append(company.name)
+
+        if synced:
+            # In a new transaction, whose snapshot includes the synced payments
+            with registry.cursor() as cr:
+                api.Environment(cr, uid, context, su=True)['monei.payment.report']._refresh()
+        # The accounts were synced in other transactions
+        self.env.invalidate_all()
+        message = _('Payments of %d companies synchronized') % len(synced)
+        if skipped:
+            message += _(', already being synchronized: %s') % ', '.join(skipped)
+        if failed:
+            message += _(', failed for: %s') % ', '.join(failed)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'warning' if failed or skipped else 'info',
+                'title': _('Information'),
+                'message': message,
+                'fadeout': 'slow',
+                'next': {
+                    'type': 'ir.actions.act_window_close',
+                }
+            },
+        }
+
+    @api.model
+    def _cron_sync_all_accounts(self):
+        """Sync the last days of every account, see monei.sync_days"""
+        days = int(self.env['ir.config_parameter'].sudo().get_param('monei.sync_days', 2) or 2)
+        date_to = fields.Datetime.now()
+        self.action_sync_all_accounts(date_from=date_to - timedelta(days=days), date_to=date_to)
+
+    @api.model
+    def _cron_purge_inactive_accounts(self, batch_size=1000):
+        """Delete payments of the accounts and modes no longer in use
+
+        Only runs when the monei.purge_inactive_accounts parameter is set.
+        Payments are deleted batch_size at a time, the cron triggers itself
+        again until every company is done.
+        """
+        if not self.env['ir.config_parameter'].sudo().get_param('monei.purge_inactive_accounts'):
+            return
+        remaining = purged = False
+        for company in self.env['res.company'].sudo().search([]):
+            Payment = self.with_company(company).sudo()
+            active_domain = Payment._get_active_account_domain()
+            if not active_domain or not any(term[0] == 'account_id' for term in active_domain):
+                # Never purge without knowing which account is the active one
+                continue
+            payments = Payment.search(
+                [('company_id', '=', company.id), ('is_active_account', '=', False)],
+                limit=batch_size + 1,
+            )
+            if len(payments) > batch_size:
+                remaining = True
+                payments = payments[:batch_size]
+            if payments:
+                self._log_info(f'Purging {len(payments)} payments of inactive MONEI accounts of {company.name}')
+                payments.unlink()
+                purged = True
+        if purged:
+            self.env['monei.payment.report']._refresh()
+        if remaining:
+            self.env.ref('monei.ir_cron_monei_purge_inactive_accounts')._trigger()
+
+    @api.model
+    def _sync_payment(self, payment_id):
+        """Create or update a single payment from the API
+
+        Returns:
+            bool: False if the charge was not found or the account is being
+            synced, in which case the running sync brings the payment in
+        """
+        api_service = MoneiAPIService(self.env)
+        if not self._try_sync_lock(api_service._get_api_key()):
+            return False
+        charge = self._safe_get(api_service.execute_query(CHARGE_QUERY, {'id': payment_id}), 'data', 'charge')
+        if not charge:
+            return False
+        store_ids = self.env['monei.store']._get_store_ids(api_service) if charge.get('storeId') else {}
+        self._process_payment_batch([charge], store_ids)
+        return True
+
+    @profiled('process_payment_batch')
+    def _process_payment_batch(self, payments, store_ids, lazy_details=False):
+        """Process a batch of payments and return counters
+
+        store_ids maps the MONEI store IDs to monei.store ids (see
+        monei.store._get_store_ids), stores missing from it are added to it.
+        In lazy details mode the charges come without their session, trace and
+        metadata blocks, which are fetched later by _hydrate_details.
+        """
         added = 0
         updated = 0
         skipped = 0
-        
-        def convert_amount_from_cents(amount):
-            """Convert amount from cents to currency units"""
-            if amount is None:
-                return 0.0
-            try:
-                return float(amount) / 100.0
-            except (ValueError, TypeError):
-                return 0.0
-        
+
+        charges = {}
         for payment in payments:
             if not payment or not isinstance(payment, dict):
                 self._log_warning(f'Invalid payment data: {payment}')
@@ -518,205 +1174,158 @@ class MoneiPayment(models.Model):
             if not payment_id:
                 self._log_warning('Payment without ID, skipping')
                 continue
+            charges[payment_id] = payment
 
-            try:
-                payment_date = self._parse_datetime(payment.get('createdAt'))
-                updated_at = self._parse_datetime(payment.get('updatedAt'))
-                page_opened_at = self._parse_datetime(payment.get('pageOpenedAt'))
-                
-                # Get card details if available
-                card_data = self._safe_get(payment, 'paymentMethod', 'card') or {}
-                
-                # Get store name from lookup
-                store_id = payment.get('storeId')
-                store_name = stores_by_id.get(store_id, '')
-                
-                # Convert amounts from cents to currency units
-                amount = convert_amount_from_cents(payment.get('amount'))
-                refunded_amount = convert_amount_from_cents(payment.get('refundedAmount'))
-                last_refund_amount = convert_amount_from_cents(payment.get('lastRefundAmount'))
-                
-                vals = {
-                    'name': payment_id,
-                    'order_id': payment.get('orderId'),
-                    'checkout_id': payment.get('checkoutId'),
-                    'authorization_code': payment.get('authorizationCode'),
-                    'livemode': payment.get('livemode', False),
-                    
-                    'amount': amount,
-                    'currency': payment.get('currency', ''),
-                    'refunded_amount': refunded_amount,
-                    'last_refund_amount': last_refund_amount,
-                    'last_refund_reason': payment.get('lastRefundReason'),
-                    
-                    'status': payment.get('status', 'PENDING'),
-                    'status_code': str(payment.get('statusCode', '')),
-                    'status_message': payment.get('statusMessage', ''),
-                    'cancellation_reason': payment.get('cancellationReason', ''),
-                    
-                    'payment_date': payment_date,
-                    'updated_at': updated_at,
-                    'page_opened_at': page_opened_at,
-                    
-                    'account_id': payment.get('accountId', ''),
-                    'store_id': store_id,
-                    'store_name': store_name,
-                    'subscription_id': payment.get('subscriptionId', ''),
-                    'terminal_id': payment.get('terminalId', ''),
-                    'provider_id': payment.get('providerId', ''),
-                    'provider_internal_id': payment.get('providerInternalId', ''),
-                    'provider_reference_id': payment.get('providerReferenceId', ''),
-                    'point_of_sale_id': payment.get('pointOfSaleId', ''),
-                    'sequence_id': payment.get('sequenceId', ''),
-                    'description': payment.get('description', ''),
-                    'descriptor': payment.get('descriptor', ''),
-                    'customer_name': self._safe_get(payment, 'customer', 'name', default=''),
-                    'customer_email': self._safe_get(payment, 'customer', 'email', default=''),
-                    'customer_phone': self._safe_get(payment, 'customer', 'phone', default=''),
-                    'payment_method': self._safe_get(payment, 'paymentMethod', 'method', default=''),
-                    'shipping_name': self._safe_get(payment, 'shippingDetails', 'name', default=''),
-                    'shipping_email': self._safe_get(payment, 'shippingDetails', 'email', default=''),
-                    'shipping_phone': self._safe_get(payment, 'shippingDetails', 'phone', default=''),
-                    'shipping_company': self._safe_get(payment, 'shippingDetails', 'company', default=''),
-                    'shipping_tax_id': self._safe_get(payment, 'shippingDetails', 'taxId', default=''),
-                    'shipping_street': self._safe_get(payment, 'shippingDetails', 'address', 'line1', default=''),
-                    'shipping_street2': self._safe_get(payment, 'shippingDetails', 'address', 'line2', default=''),
-                    'shipping_city': self._safe_get(payment, 'shippingDetails', 'address', 'city', default=''),
-                    'shipping_state': self._safe_get(payment, 'shippingDetails', 'address', 'state', default=''),
-                    'shipping_zip': self._safe_get(payment, 'shippingDetails', 'address', 'zip', default=''),
-                    'shipping_country': self._safe_get(payment, 'shippingDetails', 'address', 'country', default=''),
-                    'billing_name': self._safe_get(payment, 'billingDetails', 'name', default=''),
-                    'billing_email': self._safe_get(payment, 'billingDetails', 'email', default=''),
-                    'billing_phone': self._safe_get(payment, 'billingDetails', 'phone', default=''),
-                    'billing_company': self._safe_get(payment, 'billingDetails', 'company', default=''),
-                    'billing_tax_id': self._safe_get(payment, 'billingDetails', 'taxId', default=''),
-                    'billing_street': self._safe_get(payment, 'billingDetails', 'address', 'line1', default=''),
-                    'billing_street2': self._safe_get(payment, 'billingDetails', 'address', 'line2', default=''),
-                    'billing_city': self._safe_get(payment, 'billingDetails', 'address', 'city', default=''),
-                    'billing_state': self._safe_get(payment, 'billingDetails', 'address', 'state', default=''),
-                    'billing_zip': self._safe_get(payment, 'billingDetails', 'address', 'zip', default=''),
-                    'billing_country': self._safe_get(payment, 'billingDetails', 'address', 'country', default=''),
-                    
-                    # Card details
-                    'card_brand': card_data.get('brand'),
-                    'card_last4': card_data.get('last4'),
-                    'card_type': card_data.get('type'),
-                    'card_country': card_data.get('country'),
-                    'cardholder_name': card_data.get('cardholderName'),
-                    'cardholder_email': card_data.get('cardholderEmail'),
-                    'card_expiration': card_data.get('expiration'),
-                    'card_bank': card_data.get('bank'),
-                    'tokenization_method': card_data.get('tokenizationMethod'),
-                    'three_d_secure': card_data.get('threeDSecure'),
-                    'three_d_secure_version': card_data.get('threeDSecureVersion'),
-                    'three_d_secure_flow': card_data.get('threeDSecureFlow'),
-                    
-                    # Shop details
-                    'shop_name': self._safe_get(payment, 'shop', 'name'),
-                    'shop_country': self._safe_get(payment, 'shop', 'country'),
-
-                    # Billing Plan
-                    'billing_plan': payment.get('billingPlan'),
-
-                    # Session Details
-                    'session_ip': self._safe_get(payment, 'sessionDetails', 'ip'),
-                    'session_user_agent': self._safe_get(payment, 'sessionDetails', 'userAgent'),
-                    'session_country': self._safe_get(payment, 'sessionDetails', 'countryCode'),
-                    'session_lang': self._safe_get(payment, 'sessionDetails', 'lang'),
-                    'session_device_type': self._safe_get(payment, 'sessionDetails', 'deviceType'),
-                    'session_device_model': self._safe_get(payment, 'sessionDetails', 'deviceModel'),
-                    'session_browser': self._safe_get(payment, 'sessionDetails', 'browser'),
-                    'session_browser_version': self._safe_get(payment, 'sessionDetails', 'browserVersion'),
-                    'session_browser_accept': self._safe_get(payment, 'sessionDetails', 'browserAccept'),
-                    'session_browser_color_depth': self._safe_get(payment, 'sessionDetails', 'browserColorDepth'),
-                    'session_browser_screen_height': self._safe_get(payment, 'sessionDetails', 'browserScreenHeight'),
-                    'session_browser_screen_width': self._safe_get(payment, 'sessionDetails', 'browserScreenWidth'),
-                    'session_browser_timezone_offset': self._safe_get(payment, 'sessionDetails', 'browserTimezoneOffset'),
-                    'session_os': self._safe_get(payment, 'sessionDetails', 'os'),
-                    'session_os_version': self._safe_get(payment, 'sessionDetails', 'osVersion'),
-                    'session_source': self._safe_get(payment, 'sessionDetails', 'source'),
-                    'session_source_version': self._safe_get(payment, 'sessionDetails', 'sourceVersion'),
-
-                    # Trace Details
-                    'trace_ip': self._safe_get(payment, 'traceDetails', 'ip'),
-                    'trace_user_agent': self._safe_get(payment, 'traceDetails', 'userAgent'),
-                    'trace_country': self._safe_get(payment, 'traceDetails', 'countryCode'),
-                    'trace_lang': self._safe_get(payment, 'traceDetails', 'lang'),
-                    'trace_device_type': self._safe_get(payment, 'traceDetails', 'deviceType'),
-                    'trace_device_model': self._safe_get(payment, 'traceDetails', 'deviceModel'),
-                    'trace_browser': self._safe_get(payment, 'traceDetails', 'browser'),
-                    'trace_browser_version': self._safe_get(payment, 'traceDetails', 'browserVersion'),
-                    'trace_browser_accept': self._safe_get(payment, 'traceDetails', 'browserAccept'),
-                    'trace_os': self._safe_get(payment, 'traceDetails', 'os'),
-                    'trace_os_version': self._safe_get(payment, 'traceDetails', 'osVersion'),
-                    'trace_source': self._safe_get(payment, 'traceDetails', 'source'),
-                    'trace_source_version': self._safe_get(payment, 'traceDetails', 'sourceVersion'),
-                    'trace_user_id': self._safe_get(payment, 'traceDetails', 'userId'),
-                    'trace_user_email': self._safe_get(payment, 'traceDetails', 'userEmail'),
-                    'trace_user_name': self._safe_get(payment, 'traceDetails', 'userName'),
-
-                    # Metadata
-                    'metadata': json.dumps(payment.get('metadata', [])),
-
-                    # Payment Method Type and Details
-                    'payment_method_type': self._safe_get(payment, 'paymentMethod', 'method'),
-
-                    # PayPal Details
-                    'paypal_order_id': self._safe_get(payment, 'paymentMethod', 'paypal', 'orderId'),
-                    'paypal_payer_id': self._safe_get(payment, 'paymentMethod', 'paypal', 'payerId'),
-                    'paypal_email': self._safe_get(payment, 'paymentMethod', 'paypal', 'email'),
-                    'paypal_name': self._safe_get(payment, 'paymentMethod', 'paypal', 'name'),
-
-                    # Bizum Details
-                    'bizum_phone': self._safe_get(payment, 'paymentMethod', 'bizum', 'phoneNumber'),
-                    'bizum_integration_type': self._safe_get(payment, 'paymentMethod', 'bizum', 'integrationType'),
-
-                    # SEPA Details
-                    'sepa_accountholder_name': self._safe_get(payment, 'paymentMethod', 'sepa', 'accountholderName'),
-                    'sepa_accountholder_email': self._safe_get(payment, 'paymentMethod', 'sepa', 'accountholderEmail'),
-                    'sepa_country_code': self._safe_get(payment, 'paymentMethod', 'sepa', 'countryCode'),
-                    'sepa_bank_name': self._safe_get(payment, 'paymentMethod', 'sepa', 'bankName'),
-                    'sepa_bank_code': self._safe_get(payment, 'paymentMethod', 'sepa', 'bankCode'),
-                    'sepa_bic': self._safe_get(payment, 'paymentMethod', 'sepa', 'bic'),
-                    'sepa_last4': self._safe_get(payment, 'paymentMethod', 'sepa', 'last4'),
-
-                    # Klarna Details
-                    'klarna_billing_category': self._safe_get(payment, 'paymentMethod', 'klarna', 'billingCategory'),
-                    'klarna_auth_payment_method': self._safe_get(payment, 'paymentMethod', 'klarna', 'authPaymentMethod'),
-                }
+        if not charges:
+            return added, updated, skipped
 
-                existing = self.search([('name', '=', payment_id)])
-                if existing:
-                    # Fields that should trigger an update when changed
-                    update_fields = {
-                        'status': payment.get('status'),
-                        'status_code': str(payment.get('statusCode', '')),
-                        'refunded_amount': refunded_amount,
-                        'updated_at': updated_at,
-                    }
-                    
-                    # Check if any relevant field has changed
-                    needs_update = False
-                    for field, value in update_fields.items():
-                        if existing[field] != value:
-                            needs_update = True
-                            break
-                    
-                    if needs_update:
-                        existing.write(update_fields)
+        # Stores opened since the directory was fetched
+        missing_store_refs = {payment.get('storeId') for payment in charges.values()} - store_ids.keys() - {None, ''}
+        if missing_store_refs:
+            store_ids.update(self.env['monei.store']._add_missing_stores(missing_store_refs))
+
+        # Diff the whole page by hash in one query, unchanged payments are
+        # never read
+        hashes = {payment_id: self._get_payload_hash(payment) for payment_id, payment in charges.items()}
+        self.flush_model(['name', 'company_id', 'payload_hash'])
+        self.env.cr.execute(SQL(
+            'SELECT name, id, payload_hash FROM monei_payment WHERE company_id = %s AND name IN %s',
+            self.env.company.id, tuple(charges),
+        ))
+        existing = {name: (record_id, payload_hash) for name, record_id, payload_hash in self.env.cr.fetchall()}
+        changed = self.browse(
+            record_id for payment_id, (record_id, payload_hash) in existing.items()
+            if payload_hash != hashes[payment_id]
+        )
+
+        # New payments are created together, with one daily summary upsert
+        new_vals = {}
+        for payment_id, payment in charges.items():
+            try:
+                if payment_id in existing:
+                    record_id, payload_hash = existing[payment_id]
+                    if payload_hash == hashes[payment_id]:
+                        skipped += 1
+                        continue
+                    # Read in batch with the other changed payments of the page
+                    record = changed.browse(record_id).with_prefetch(changed._prefetch_ids)
+                    vals = record._get_changed_vals(self._prepare_sync_vals(payment, store_ids, lazy_details))
+                    vals['payload_hash'] = hashes[payment_id]
+                    record.write(vals)
+                    if len(vals) > 1:
                         updated += 1
                     else:
                         skipped += 1
                 else:
-                    self.create(vals)
-                    added += 1
+                    vals = self._prepare_sync_vals(payment, store_ids, lazy_details)
+                    vals['payload_hash'] = hashes[payment_id]
+                    if lazy_details:
+                        vals['details_loaded'] = False
+                    new_vals[payment_id] = vals
 
             except Exception as e:
                 self._log_error(f'Error processing payment {payment_id}: {e}')
                 continue
-        
+
+        if new_vals:
+            try:
+                with self.env.cr.savepoint():
+                    self.create(list(new_vals.values()))
+                added += len(new_vals)
+            except Exception as e:
+                # Find the faulty payments, the others are still added
+                self._log_warning(f'Batch creation of {len(new_vals)} payments failed, creating them one by one: {e}')
+                for payment_id, vals in new_vals.items():
+                    try:
+                        with self.env.cr.savepoint():
+                            self.create(vals)
+                        added += 1
+                    except Exception as e:
+                        self._log_error(f'Error processing payment {payment_id}: {e}')
+
         return added, updated, skipped 
 
+    def _get_payload_hash(self, payment):
+        """Hash of the normalized charge payload"""
+        return hashlib.blake2b(
+            json_codec.dumps_canonical(payment), digest_size=16, person=PAYLOAD_HASH_VERSION,
+        ).hexdigest()
+
+    def _prepare_sync_vals(self, payment, store_ids, lazy_details=False):
+        """Build the payment values of a charge
+
+        In lazy details mode the charge has no detail blocks, which are left
+        untouched.
+        """
+        vals = CHARGE_CORE_MAPPING.to_vals(payment)
+        vals['company_id'] = self.env.company.id
+        vals['store_id'] = store_ids.get(vals.pop('store_ref'), False)
+        if not lazy_details:
+            vals.update(self._prepare_detail_vals(payment))
+        return vals
+
+    def _get_changed_vals(self, vals):
+        """Return the subset of vals that differs from the record values"""
+        self.ensure_one()
+        changed = {}
+        for fname, value in vals.items():
+            field = self._fields[fname]
+            new_value = field.convert_to_record(field.convert_to_cache(value, self), self)
+            if field.convert_to_write(new_value, self) != field.convert_to_write(self[fname], self):
+                changed[fname] = value
+        return changed
+
+    def _prepare_detail_vals(self, payment):
+        """Build the values of the heavy detail blocks of a charge
+        (session, trace and metadata)"""
+        return CHARGE_DETAIL_MAPPING.to_vals(payment)
+
+    @api.model
+    def _is_lazy_details_enabled(self):
+        """Whether sync should skip the heavy detail blocks of the charges"""
+        return bool(self.env['ir.config_parameter'].sudo().get_param('monei.lazy_details'))
+
+    def _get_lazy_detail_fields(self):
+        """Fields filled by _prepare_detail_vals, only known once hydrated"""
+        session_fields = self.env[self._detail_models['session_detail_id']]._fields
+        return {
+            fname for fname, field in session_fields.items() if not field.automatic
+        } | {'metadata', 'metadata_display'}
+
+    def _hydrate_details(self):
+        """Fetch and store the detail blocks of payments synced in lazy mode
+
+        On a read-only cursor (web_read may run on one) the write fails with
+        ReadOnlySqlTransaction, which is raised so that the request is
+        retried on a read/write cursor.
+        """
+        for record in self.filtered(lambda payment: not payment.details_loaded):
+            api_service = MoneiAPIService(self.env, company=record.company_id)
+            try:
+                response = api_service.execute_query(CHARGE_DETAILS_QUERY, {'id': record.name})
+                charge = self._safe_get(response, 'data', 'charge')
+                if not charge:
+                    self._log_warning(f'Charge {record.name} not found while loading its details')
+                    continue
+                vals = self._prepare_detail_vals(charge)
+                vals['details_loaded'] = True
+                # A failed write must not abort the transaction of the read
+                with self.env.cr.savepoint():
+                    record.write(vals)
+            except ReadOnlySqlTransaction:
+                raise
+            except Exception as e:
+                # Never block the form because of the details
+                self._log_warning(f'Could not load details of payment {record.name}: {e}')
+
+    def web_read(self, specification):
+        """Override to load the details of lazily synced payments the first
+        time they are opened"""
+        if len(self) == 1 and not self.details_loaded and \
+                self._get_lazy_detail_fields().intersection(specification):
+            self._hydrate_details()
+        return super().web_read(specification)
+
     def action_capture_payment(self):
         self.ensure_one()
         if self.status != 'AUTHORIZED':
@@ -843,6 +1452,7 @@ class MoneiPayment(models.Model):
 
         self.write(vals)
 
+    @profiled('link_orders')
     def action_link_orders(self):
         """Link payments with their corresponding sale orders"""
         linked = 0
@@ -883,10 +1493,10 @@ class MoneiPayment(models.Model):
 
     @api.depends('name')
     def _compute_payment_url(self):
-        api_service = MoneiAPIService(self.env)
+        dashboard_url = self.env['res.config.settings']._get_api_url('dashboard')
         for record in self:
             if record.name:
-                record.payment_url = api_service._get_payment_url(record.name)
+                record.payment_url = f"{dashboard_url}/payments/{record.name}"
             else:
                 record.payment_url = False
             
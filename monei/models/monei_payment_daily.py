@@ -0,0 +1,179 @@
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+# Statuses counted in the daily volume
+SUCCEEDED_STATUSES = ('SUCCEEDED', 'PARTIALLY_REFUNDED', 'REFUNDED')
+
+# Counters maintained for each day
+DAILY_COUNTERS = ('payment_count', 'succeeded_count', 'failed_count', 'amount', 'refunded_amount')
+
+
+class MoneiPaymentDaily(models.Model):
+    _name = 'monei.payment.daily'
+    _description = 'MONEI Daily Payment Summary'
+    _order = 'date desc'
+    _rec_name = 'date'
+
+    date = fields.Date(string='Date', required=True, readonly=True, index=True)
+    company_id = fields.Many2one(
+        'res.company', string='Company', required=True, readonly=True, index=True,
+        default=lambda self: self.env.company,
+    )
+    # Payments of every account and mode are kept, each has its own summary.
+    # The account is '' rather than NULL so that it takes part in the unique key.
+    account_id = fields.Char(string='Account ID', required=True, readonly=True, default='')
+    livemode = fields.Boolean(string='Live Mode', readonly=True)
+    is_active_account = fields.Boolean(
+        string='Active Account',
+        compute='_compute_is_active_account',
+        search='_search_is_active_account',
+    )
+    payment_count = fields.Integer(string='Payments', readonly=True)
+    succeeded_count = fields.Integer(string='Succeeded Payments', readonly=True)
+    failed_count = fields.Integer(string='Failed Payments', readonly=True)
+    amount = fields.Float(string='Volume', readonly=True, help='Amount of the succeeded payments')
+    refunded_amount = fields.Float(string='Refunded Amount', readonly=True)
+    failure_rate = fields.Float(
+        string='Failure Rate (%)',
+        compute='_compute_failure_rate'
+    )
+
+    _sql_constraints = [
+        ('date_unique', 'unique(date, company_id, account_id, livemode)',
+         'There can only be one summary per day, company, account and mode.'),
+    ]
+
+    @api.depends('account_id', 'livemode')
+    def _compute_is_active_account(self):
+        active_rows = self.filtered_domain(self.env['monei.payment']._get_active_account_domain())
+        for record in self:
+            record.is_active_account = record in active_rows
+
+    def _search_is_active_account(self, operator, value):
+        # Same account and livemode columns as the payments
+        return self.env['monei.payment']._search_is_active_account(operator, value)
+
+    @api.depends('payment_count', 'failed_count')
+    def _compute_failure_rate(self):
+        for record in self:
+            record.failure_rate = (
+                100.0 * record.failed_count / record.payment_count if record.payment_count else 0.0
+            )
+
+    def init(self):
+        super().init()
+        # Build the summary from the existing payments on first install
+        self.env.cr.execute(SQL('SELECT 1 FROM %s LIMIT 1', SQL.identifier(self._table)))
+        if not self.env.cr.rowcount:
+            self._rebuild()
+
+    @api.model
+    def _get_contribution(self, status, amount, refunded_amount):
+        """Counters a single payment adds to the summary of its day"""
+        succeeded = status in SUCCEEDED_STATUSES
+        return (
+            1,
+            1 if succeeded else 0,
+            1 if status == 'FAILED' else 0,
+            (amount or 0.0) if succeeded else 0.0,
+            refunded_amount or 0.0,
+        )
+
+    @api.model
+    def _apply_deltas(self, added=(), removed=()):
+        """Update the daily summary with the payments added and removed
+
+        A changed payment is removed with its old values and added with the
+        new ones, so only the days and counters that moved get updated.
+
+        Args:
+            added: iterable of (payment_date, company_id, account_id, livemode,
+                status, amount, refunded_amount)
+            removed: same as added
+        """
+        deltas = {}
+        for sign, rows in ((1, added), (-1, removed)):
+            for payment_date, company_id, account_id, livemode, status, amount, refunded_amount in rows:
+                if not payment_date:
+                    continue
+                key = (fields.Date.to_date(payment_date), company_id, account_id or '', bool(livemode))
+                contribution = self._get_contribution(status, amount, refunded_amount)
+                current = deltas.get(key, (0, 0, 0, 0.0, 0.0))
+                deltas[key] = tuple(c + sign * v for c, v in zip(current, contribution))
+
+        deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+
+        columns = SQL(', ').join(SQL.identifier(name) for name in DAILY_COUNTERS)
+        values = SQL(', ').join(
+            SQL("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now() at time zone 'UTC', %s, now() at time zone 'UTC')",
+                day, company_id, account_id, livemode, *delta, self.env.uid, self.env.uid)
+            for (day, company_id, account_id, livemode), delta in sorted(deltas.items())
+        )
+        updates = SQL(', ').join(
+            SQL('%s = %s.%s + EXCLUDED.%s',
+                SQL.identifier(name), SQL.identifier(self._table), SQL.identifier(name), SQL.identifier(name))
+            for name in DAILY_COUNTERS
+        )
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO %s (date, company_id, account_id, livemode, %s, create_uid, create_date, write_uid, write_date)
+                 VALUES %s
+            ON CONFLICT (date, company_id, account_id, livemode) DO UPDATE
+                    SET %s, write_uid = EXCLUDED.write_uid, write_date = EXCLUDED.write_date
+            """,
+            SQL.identifier(self._table), columns, values, updates,
+        ))
+        self.invalidate_model(DAILY_COUNTERS)
+
+    @api.model
+    def _rebuild(self):
+        """Recompute the whole summary from the payments table"""
+        self.env['monei.payment'].flush_model(list(self.env['monei.payment']._daily_fields))
+        self.env.cr.execute(SQL('DELETE FROM %s', SQL.identifier(self._table)))
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO %s (date, company_id, account_id, livemode,
+                            payment_count, succeeded_count, failed_count, amount, refunded_amount,
+                            create_uid, create_date, write_uid, write_date)
+                 SELECT payment_date::date,
+                        company_id,
+                        COALESCE(account_id, ''),
+                        COALESCE(livemode, FALSE),
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE status IN %s),
+                        COUNT(*) FILTER (WHERE status = 'FAILED'),
+                        COALESCE(SUM(amount) FILTER (WHERE status IN %s), 0),
+                        COALESCE(SUM(refunded_amount), 0),
+                        %s, now() at time zone 'UTC', %s, now() at time zone 'UTC'
+                   FROM monei_payment
+                  WHERE payment_date IS NOT NULL
+               GROUP BY payment_date::date, company_id, COALESCE(account_id, ''), COALESCE(livemode, FALSE)
+            """,
+            SQL.identifier(self._table), SUCCEEDED_STATUSES, SUCCEEDED_STATUSES, self.env.uid, self.env.uid,
+        ))
+        self.invalidate_model()
+
+    @api.model
+    def get_kpis(self, day=None):
+        """Return the key figures of a day (today by default) for the active
+        account and mode of the current company"""
+        day = day or fields.Date.context_today(self)
+        # Several rows match when the active account is unknown
+        [(payment_count, failed_count, amount, refunded_amount)] = self._read_group(
+            [
+                ('date', '=', day),
+                ('company_id', '=', self.env.company.id),
+                ('is_active_account', '=', True),
+            ],
+            aggregates=['payment_count:sum', 'failed_count:sum', 'amount:sum', 'refunded_amount:sum'],
+        )
+        payment_count = payment_count or 0
+        return {
+            'date': fields.Date.to_string(day),
+            'payment_count': payment_count,
+            'volume': amount or 0.0,
+            'refunded_amount': refunded_amount or 0.0,
+            'failure_rate': 100.0 * (failed_count or 0) / payment_count if payment_count else 0.0,
+        }
@@ -0,0 +1,106 @@
+from odoo import fields, models
+
+# Rarely read detail blocks of monei.payment live in these one-to-one
+# companion tables so the main payment rows stay narrow. The payment model
+# exposes them through related fields and routes writes to them.
+
+
+class MoneiPaymentAddress(models.Model):
+    _name = 'monei.payment.address'
+    _description = 'MONEI Payment Address Details'
+
+    # Shipping Details
+    shipping_name = fields.Char(string='Shipping Name', readonly=True)
+    shipping_email = fields.Char(string='Shipping Email', readonly=True)
+    shipping_phone = fields.Char(string='Shipping Phone', readonly=True)
+    shipping_company = fields.Char(string='Shipping Company', readonly=True)
+    shipping_tax_id = fields.Char(string='Shipping Tax ID', readonly=True)
+
+    # Shipping Address
+    shipping_street = fields.Char(string='Shipping Street', readonly=True)
+    shipping_street2 = fields.Char(string='Shipping Street 2', readonly=True)
+    shipping_city = fields.Char(string='Shipping City', readonly=True)
+    shipping_state = fields.Char(string='Shipping State', readonly=True)
+    shipping_zip = fields.Char(string='Shipping ZIP', readonly=True)
+    shipping_country = fields.Char(string='Shipping Country', readonly=True)
+
+    # Billing Details
+    billing_name = fields.Char(string='Billing Name', readonly=True)
+    billing_email = fields.Char(string='Billing Email', readonly=True)
+    billing_phone = fields.Char(string='Billing Phone', readonly=True)
+    billing_company = fields.Char(string='Billing Company', readonly=True)
+    billing_tax_id = fields.Char(string='Billing Tax ID', readonly=True)
+
+    # Billing Address
+    billing_street = fields.Char(string='Billing Street', readonly=True)
+    billing_street2 = fields.Char(string='Billing Street 2', readonly=True)
+    billing_city = fields.Char(string='Billing City', readonly=True)
+    billing_state = fields.Char(string='Billing State', readonly=True)
+    billing_zip = fields.Char(string='Billing ZIP', readonly=True)
+    billing_country = fields.Char(string='Billing Country', readonly=True)
+
+
+class MoneiPaymentSession(models.Model):
+    _name = 'monei.payment.session'
+    _description = 'MONEI Payment Session Details'
+
+    # Session Details
+    session_ip = fields.Char(string='Session IP', readonly=True)
+    session_user_agent = fields.Char(string='Session User Agent', readonly=True)
+    session_country = fields.Char(string='Session Country', readonly=True)
+    session_lang = fields.Char(string='Session Language', readonly=True)
+    session_device_type = fields.Char(string='Session Device Type', readonly=True)
+    session_device_model = fields.Char(string='Session Device Model', readonly=True)
+    session_browser = fields.Char(string='Session Browser', readonly=True)
+    session_browser_version = fields.Char(string='Session Browser Version', readonly=True)
+    session_browser_accept = fields.Char(string='Session Browser Accept', readonly=True)
+    session_browser_color_depth = fields.Integer(string='Session Browser Color Depth', readonly=True)
+    session_browser_screen_height = fields.Integer(string='Session Browser Screen Height', readonly=True)
+    session_browser_screen_width = fields.Integer(string='Session Browser Screen Width', readonly=True)
+    session_browser_timezone_offset = fields.Integer(string='Session Browser Timezone Offset', readonly=True)
+    session_os = fields.Char(string='Session OS', readonly=True)
+    session_os_version = fields.Char(string='Session OS Version', readonly=True)
+    session_source = fields.Char(string='Session Source', readonly=True)
+    session_source_version = fields.Char(string='Session Source Version', readonly=True)
+
+    # Trace Details
+    trace_ip = fields.Char(string='Trace IP', readonly=True)
+    trace_user_agent = fields.Char(string='Trace User Agent', readonly=True)
+    trace_country = fields.Char(string='Trace Country', readonly=True)
+    trace_lang = fields.Char(string='Trace Language', readonly=True)
+    trace_device_type = fields.Char(string='Trace Device Type', readonly=True)
+    trace_device_model = fields.Char(string='Trace Device Model', readonly=True)
+    trace_browser = fields.Char(string='Trace Browser', readonly=True)
+    trace_browser_version = fields.Char(string='Trace Browser Version', readonly=True)
+    trace_browser_accept = fields.Char(string='Trace Browser Accept', readonly=True)
+    trace_os = fields.Char(string='Trace OS', readonly=True)
+    trace_os_version = fields.Char(string='Trace OS Version', readonly=True)
+    trace_source = fields.Char(string='Trace Source', readonly=True)
+    trace_source_version = fields.Char(string='Trace Source Version', readonly=True)
+    trace_user_id = fields.Char(string='Trace User ID', readonly=True)
+    trace_user_email = fields.Char(string='Trace User Email', readonly=True)
+    trace_user_name = fields.Char(string='Trace User Name', readonly=True)
+
+
+class MoneiPaymentMethodDetail(models.Model):
+    _name = 'monei.payment.method.detail'
+    _description = 'MONEI Payment Method Details'
+
+    # PayPal specific fields
+    paypal_order_id = fields.Char(string='PayPal Order ID', readonly=True)
+    paypal_payer_id = fields.Char(string='PayPal Payer ID', readonly=True)
+    paypal_email = fields.Char(string='PayPal Email', readonly=True)
+    paypal_name = fields.Char(string='PayPal Name', readonly=True)
+
+    # SEPA specific fields
+    sepa_accountholder_name = fields.Char(string='SEPA Account Holder Name', readonly=True)
+    sepa_accountholder_email = fields.Char(string='SEPA Account Holder Email', readonly=True)
+    sepa_country_code = fields.Char(string='SEPA Country Code', readonly=True)
+    sepa_bank_name = fields.Char(string='SEPA Bank Name', readonly=True)
+    sepa_bank_code = fields.Char(string='SEPA Bank Code', readonly=True)
+    sepa_bic = fields.Char(string='SEPA BIC', readonly=True)
+    sepa_last4 = fields.Char(string='SEPA Last 4', readonly=True)
+
+    # Klarna specific fields
+    klarna_billing_category = fields.Char(string='Klarna Billing Category', readonly=True)
+    klarna_auth_payment_method = fields.Char(string='Klarna Auth Payment Method', readonly=True)
@@ -0,0 +1,96 @@
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+
+class MoneiPaymentReport(models.Model):
+    _name = 'monei.payment.report'
+    _description = 'MONEI Payment Analysis'
+    _auto = False
+    _order = 'date desc'
+    _rec_name = 'date'
+
+    date = fields.Date(string='Date', readonly=True)
+    status = fields.Selection(
+        selection=lambda self: self.env['monei.payment']._fields['status'].selection,
+        string='Status',
+        readonly=True
+    )
+    payment_method = fields.Char(string='Payment Method', readonly=True)
+    card_brand = fields.Char(string='Card Brand', readonly=True)
+    store_id = fields.Many2one('monei.store', string='Store', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    account_id = fields.Char(string='Account ID', readonly=True)
+    livemode = fields.Boolean(string='Live Mode', readonly=True)
+    is_active_account = fields.Boolean(
+        string='Active Account',
+        compute='_compute_is_active_account',
+        search='_search_is_active_account',
+    )
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    refunded_amount = fields.Monetary(string='Refunded Amount', currency_field='currency_id', readonly=True)
+    payment_count = fields.Integer(string='# Payments', readonly=True)
+
+    @api.depends('account_id', 'livemode')
+    def _compute_is_active_account(self):
+        active_rows = self.filtered_domain(self.env['monei.payment']._get_active_account_domain())
+        for record in self:
+            record.is_active_account = record in active_rows
+
+    def _search_is_active_account(self, operator, value):
+        # Same account and livemode columns as the payments
+        return self.env['monei.payment']._search_is_active_account(operator, value)
+
+    def _query(self):
+        """Payments pre-aggregated by day and reporting dimensions"""
+        return SQL(
+            """
+            SELECT row_number() OVER (ORDER BY date, company_id, account_id, livemode, status, payment_method,
+                                                card_brand, store_id, currency_id) AS id,
+                   grouped.*
+              FROM (
+                    SELECT p.payment_date::date AS date,
+                           p.status AS status,
+                           p.payment_method AS payment_method,
+                           p.card_brand AS card_brand,
+                           p.store_id AS store_id,
+                           p.currency_id AS currency_id,
+                           p.company_id AS company_id,
+                           p.account_id AS account_id,
+                           p.livemode AS livemode,
+                           SUM(p.amount) AS amount,
+                           SUM(p.refunded_amount) AS refunded_amount,
+                           COUNT(*) AS payment_count
+                      FROM monei_payment p
+                  GROUP BY p.payment_date::date, p.status, p.payment_method,
+                           p.card_brand, p.store_id, p.currency_id, p.company_id,
+                           p.account_id, p.livemode
+                   ) grouped
+            """
+        )
+
+    def init(self):
+        cr = self.env.cr
+        cr.execute(SQL('DROP VIEW IF EXISTS %s CASCADE', SQL.identifier(self._table)))
+        cr.execute(SQL('DROP MATERIALIZED VIEW IF EXISTS %s CASCADE', SQL.identifier(self._table)))
+        cr.execute(SQL(
+            'CREATE MATERIALIZED VIEW %s AS (%s)',
+            SQL.identifier(self._table),
+            self._query(),
+        ))
+        # A unique index is required to refresh the view concurrently
+        cr.execute(SQL(
+            'CREATE UNIQUE INDEX %s ON %s (id)',
+            SQL.identifier(f'{self._table}_id_index'),
+            SQL.identifier(self._table),
+        ))
+
+    @api.model
+    def _refresh(self):
+        """Refresh the aggregates, called after each payment sync"""
+        self.env.flush_all()
+        self.env.cr.execute(SQL(
+            'REFRESH MATERIALIZED VIEW CONCURRENTLY %s',
+            SQL.identifier(self._table),
+        ))
+        self.invalidate_model()
@@ -2,12 +2,12 @@ import re
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError, UserError
 import requests
-from odoo.tools import config
+from odoo.tools import config, ormcache
 from datetime import datetime, timedelta
 from ..utils.date_utils import get_month_date_range
 import logging
 import json
-from ..services.api_service import MoneiAPIService
+from ..services.api_service import CONNECT_TIMEOUT, READ_TIMEOUT, MoneiAPIService, ServiceConfig
 
 logger = logging.getLogger(__name__)
 
@@ -19,32 +19,134 @@ class ResConfigSettings(models.TransientModel):
         config_parameter='monei.api_key',
         help="Your MONEI API Key"
     )
+    monei_company_api_key = fields.Char(
+        string="Company API Key",
+        related='company_id.monei_api_key',
+        readonly=False,
+        help="API Key of this company's MONEI account, overrides the global API Key for this company"
+    )
+    monei_purge_inactive_accounts = fields.Boolean(
+        string="Purge Other Accounts",
+        config_parameter='monei.purge_inactive_accounts',
+        help="Delete in the background the payments of accounts and modes other than the one of the API Key in use"
+    )
+    monei_sync_workers = fields.Integer(
+        string="Parallel Account Syncs",
+        config_parameter='monei.sync_workers',
+        default=4,
+        help="Number of MONEI accounts synced at the same time by the all accounts sync"
+    )
+    monei_lazy_details = fields.Boolean(
+        string="Lazy Payment Details",
+        config_parameter='monei.lazy_details',
+        help="Sync only the core payment fields and fetch session, trace and "
+             "metadata details the first time a payment is opened"
+    )
+    monei_sync_prefetch_pages = fields.Integer(
+        string="Prefetched Pages",
+        config_parameter='monei.sync_prefetch_pages',
+        default=2,
+        help="Number of payment pages fetched in the background while the "
+             "current one is processed, 0 to fetch them one after the other"
+    )
+    monei_sync_page_size_min = fields.Integer(
+        string="Minimum Page Size",
+        config_parameter='monei.sync_page_size_min',
+        default=100,
+        help="Smallest number of payments requested per page, pages shrink "
+             "down to it when the API is slow or times out"
+    )
+    monei_sync_page_size_max = fields.Integer(
+        string="Maximum Page Size",
+        config_parameter='monei.sync_page_size_max',
+        default=1000,
+        help="Largest number of payments requested per page, pages grow up "
+             "to it when the API answers fast"
+    )
+    monei_sync_deadline = fields.Integer(
+        string="Sync Time Limit (s)",
+        config_parameter='monei.sync_deadline',
+        help="Seconds after which a sync stops fetching pages and keeps the "
+             "payments synced so far, 0 for no limit"
+    )
+    monei_connect_timeout = fields.Float(
+        string="Connect Timeout (s)",
+        config_parameter='monei.connect_timeout',
+        default=5.0,
+        help="Seconds to wait for the connection to the MONEI API"
+    )
+    monei_read_timeout = fields.Float(
+        string="Read Timeout (s)",
+        config_parameter='monei.read_timeout',
+        default=30.0,
+        help="Seconds to wait for data from the MONEI API before the request "
+             "is considered timed out"
+    )
+    monei_stream_pages = fields.Boolean(
+        string="Stream Payment Pages",
+        config_parameter='monei.stream_pages',
+        help="Parse the payment pages while they download and process them "
+             "in chunks, requires the ijson Python package"
+    )
     
+    monei_graphql_url = fields.Char(
+        string="GraphQL API URL",
+        config_parameter='monei.graphql_url',
+        help="Base URL of the MONEI GraphQL API. Leave empty to use https://graphql.monei.com"
+    )
+    monei_dashboard_url = fields.Char(
+        string="Dashboard URL",
+        config_parameter='monei.dashboard_url',
+        help="Base URL of the MONEI Dashboard. Leave empty to use https://dashboard.monei.com"
+    )
+    monei_metrics_token = fields.Char(
+        string="Metrics Token",
+        config_parameter='monei.metrics_token',
+        help="Bearer token required to scrape the /monei/metrics endpoint. The endpoint is disabled while empty."
+    )
+
     def set_values(self):
-        """Override to handle payment deletion when API key changes"""
+        """Override to notify the user when the API key changes
+
+        Payments are tagged with their account and mode, so the payments of
+        the previous key are only hidden and come back when switching back.
+        They are purged in the background when Purge Other Accounts is set.
+        """
         old_api_key = self.env['ir.config_parameter'].sudo().get_param('monei.api_key')
         
         # Save new values
         res = super().set_values()
         
-        # If API key changed, delete all payments
         if self.monei_api_key != old_api_key:
-            self.env['monei.payment'].sudo().search([]).unlink()
+            # The companies without their own key switch to another store directory
+            self.env['res.company'].sudo().search([]).monei_stores_refreshed_at = False
+            if self.monei_purge_inactive_accounts:
+                self.env.ref('monei.ir_cron_monei_purge_inactive_accounts')._trigger()
+                message = _('API configuration changed. Payments of the previous account will be deleted in the background.')
+            else:
+                message = _('API configuration changed. Payments of the previous account are hidden and will be shown again if you switch back to it.')
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
                     'title': _('Warning'),
-                    'message': _('API configuration changed. All existing payments have been deleted and will be re-synced with the new account.'),
+                    'message': message,
                     'type': 'warning',
                     'sticky': True,
                 }
             }
         return res
     
+    @api.model
+    @ormcache('subdomain')
     def _get_api_url(self, subdomain='graphql'):
         """Get the API URL
-        
+
+        The URL can be overridden with the monei.<subdomain>_url system
+        parameter (e.g. to use a local stand-in or an egress proxy). The result
+        is cached per registry and invalidated whenever a system parameter
+        changes.
+
         Args:
             subdomain (str): The subdomain to use (default: graphql)
                            Examples: graphql, dashboard
@@ -52,8 +154,31 @@ class ResConfigSettings(models.TransientModel):
         Returns:
             str: The complete API URL
         """
+        url = self.env['ir.config_parameter'].sudo().get_param(f'monei.{subdomain}_url')
+        if url:
+            return url.rstrip('/')
         return f'https://{subdomain}.monei.com'
 
+    @api.model
+    @ormcache('company_id')
+    def _get_monei_service_config(self, company_id):
+        """URLs, API key and timeouts of the MONEI API services of a company
+
+        Cached per registry like _get_api_url. The cache is cleared when a
+        system parameter or an API key changes (see res.company.write).
+        """
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        company = self.env['res.company'].sudo().browse(company_id)
+        return ServiceConfig(
+            graphql_url=self._get_api_url('graphql'),
+            dashboard_url=self._get_api_url('dashboard'),
+            api_key=company.monei_api_key or get_param('monei.api_key') or None,
+            timeout=(
+                float(get_param('monei.connect_timeout') or CONNECT_TIMEOUT),
+                float(get_param('monei.read_timeout') or READ_TIMEOUT),
+            ),
+        )
+
     @api.constrains('monei_api_key')
     def _check_api_key(self):
         """Validate API key format and trigger initial sync if needed"""
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from odoo import api, fields, models, _
+
+from ..graphql.queries import STORES_QUERY
+from ..services.api_service import MoneiAPIService
+
+# Default seconds after which the store directory is fetched again
+STORE_TTL = 24 * 3600
+
+
+class MoneiStore(models.Model):
+    _name = 'monei.store'
+    _inherit = ['monei.mixin']
+    _description = 'MONEI Store'
+    _order = 'name'
+
+    name = fields.Char(string='Name', required=True, readonly=True)
+    store_ref = fields.Char(string='Store ID', required=True, readonly=True, index=True)
+    company_id = fields.Many2one(
+        'res.company', string='Company', required=True, readonly=True, index=True,
+        default=lambda self: self.env.company,
+    )
+
+    _sql_constraints = [
+        ('store_ref_unique', 'unique(store_ref, company_id)', 'A MONEI store can only be added once per company.'),
+    ]
+
+    @api.model
+    def _is_directory_fresh(self):
+        """Whether the current company's stores were fetched within monei.store_ttl seconds"""
+        refreshed_at = self.env.company.sudo().monei_stores_refreshed_at
+        if not refreshed_at:
+            return False
+        ttl = int(self.env['ir.config_parameter'].sudo().get_param('monei.store_ttl') or STORE_TTL)
+        return refreshed_at > fields.Datetime.now() - timedelta(seconds=ttl)
+
+    @api.model
+    def _get_store_ids(self, api_service=None, force=False):
+        """Map the MONEI store IDs of the current company to their records
+
+        The directory is fetched from the API only when it is older than its
+        TTL, or with force.
+        """
+        if force or not self._is_directory_fresh():
+            self._refresh_directory(api_service or MoneiAPIService(self.env))
+        stores = self.sudo().search([('company_id', '=', self.env.company.id)])
+        return {store.store_ref: store.id for store in stores}
+
+    @api.model
+    def _refresh_directory(self, api_service):
+        """Fetch the stores of the account and update their names
+
+        Stores missing from the answer are kept, payments may still refer to
+        them.
+        """
+        company = self.env.company
+        response = api_service.execute_query(STORES_QUERY)
+        stores = self._safe_get(response, 'data', 'stores', 'items') or []
+        existing = {
+            store.store_ref: store
+            for store in self.sudo().search([('company_id', '=', company.id)])
+        }
+        new_vals = []
+        for store in stores:
+            if not store or not store.get('id'):
+                continue
+            name = store.get('name') or store['id']
+            record = existing.get(store['id'])
+            if record is None:
+                new_vals.append({'name': name, 'store_ref': store['id'], 'company_id': company.id})
+            elif record.name != name:
+                record.name = name
+        if new_vals:
+            self.sudo().create(new_vals)
+        company.sudo().monei_stores_refreshed_at = fields.Datetime.now()
+
+    @api.model
+    def _add_missing_stores(self, store_refs):
+        """Add stores that are not in the directory yet and return their ids by MONEI ID
+
+        They are named after their ID and the directory is marked stale, so
+        their names are fetched by the next sync.
+        """
+        company = self.env.company
+        stores = self.sudo().create([
+            {'name': store_ref, 'store_ref': store_ref, 'company_id': company.id}
+            for store_ref in store_refs
+        ])
+        company.sudo().monei_stores_refreshed_at = False
+        return {store.store_ref: store.id for store in stores}
+
+    @api.model
+    def action_refresh_stores(self):
+        """Fetch the store directory now"""
+        self._refresh_directory(MoneiAPIService(self.env))
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'info',
+                'title': _('Information'),
+                'message': _('Stores refreshed'),
+                'fadeout': 'slow',
+                'next': {
+                    'type': 'ir.actions.client',
+                    'tag': 'reload',
+                }
+            },
+        }
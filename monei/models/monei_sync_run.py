@@ -0,0 +1,129 @@
+from odoo import _, api, fields, models
+
+
+class MoneiSyncRun(models.Model):
+    _name = 'monei.sync.run'
+    _description = 'MONEI Sync Run'
+    _order = 'start_date desc, id desc'
+    _rec_name = 'start_date'
+
+    start_date = fields.Datetime(string='Started At', readonly=True)
+    end_date = fields.Datetime(string='Finished At', readonly=True)
+    state = fields.Selection([
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='running', readonly=True)
+    mode = fields.Selection([
+        ('full', 'Full Details'),
+        ('lazy', 'Lazy Details'),
+    ], string='Mode', readonly=True)
+    date_from = fields.Datetime(string='From Date', readonly=True)
+    date_to = fields.Datetime(string='To Date', readonly=True)
+    user_id = fields.Many2one('res.users', string='User', readonly=True)
+    company_id = fields.Many2one('res.company', string='Company', readonly=True, index=True)
+    backend_pid = fields.Integer(string='Backend PID', readonly=True,
+                                 help='PostgreSQL backend of the sync transaction, it holds the sync lock of the account')
+
+    # Counters
+    pages_fetched = fields.Integer(string='Pages', readonly=True)
+    rows_processed = fields.Integer(string='Rows', readonly=True)
+    added_count = fields.Integer(string='Added', readonly=True)
+    updated_count = fields.Integer(string='Updated', readonly=True)
+    skipped_count = fields.Integer(string='Unchanged', readonly=True)
+    deleted_count = fields.Integer(string='Deleted', readonly=True)
+
+    # Timings
+    duration = fields.Float(string='Duration (s)', readonly=True, aggregator='avg')
+    api_duration = fields.Float(string='API Time (s)', readonly=True, aggregator='avg')
+    processing_duration = fields.Float(string='Processing Time (s)', readonly=True, aggregator='avg')
+    query_count = fields.Integer(string='SQL Queries', readonly=True)
+    rows_per_second = fields.Float(string='Rows/s', readonly=True, aggregator='avg')
+
+    deadline_reached = fields.Boolean(string='Deadline Reached', readonly=True,
+                                      help='The sync stopped fetching pages at its deadline, see monei.sync_deadline')
+    error = fields.Text(string='Error', readonly=True)
+    profile_report = fields.Text(string='Profile', readonly=True)
+    profile_path = fields.Char(string='Profile File', readonly=True)
+    page_ids = fields.One2many('monei.sync.run.page', 'run_id', string='Pages', readonly=True)
+
+    # Runs are logged through their own cursor, so they are visible while the
+    # sync is still running and kept when the sync transaction is rolled back.
+
+    @api.model
+    def _start(self, vals):
+        """Create a running sync run and return its id
+
+        Must be called holding the sync lock of the company's account: the
+        other runs of the company still running were left by a worker that
+        died, they are closed as failed.
+        """
+        self.env.cr.execute('SELECT pg_backend_pid()')
+        backend_pid = self.env.cr.fetchone()[0]
+        with self.env.registry.cursor() as cr:
+            Run = self.env(cr=cr)[self._name].sudo()
+            stale_runs = Run.search([('state', '=', 'running'), ('company_id', '=', self.env.company.id)])
+            if stale_runs:
+                stale_runs.write({
+                    'state': 'failed',
+                    'end_date': fields.Datetime.now(),
+                    'error': _('The synchronization stopped without finishing, e.g. its worker was killed.'),
+                })
+            run = Run.create(dict(
+                vals,
+                start_date=fields.Datetime.now(),
+                user_id=self.env.uid,
+                company_id=self.env.company.id,
+                backend_pid=backend_pid,
+                state='running',
+            ))
+            return run.id
+
+    @api.model
+    def _get_running(self, backend_pid):
+        """Running run of the current company synced by a PostgreSQL backend"""
+        if not backend_pid:
+            return self.browse()
+        return self.sudo().search([
+            ('state', '=', 'running'),
+            ('company_id', '=', self.env.company.id),
+            ('backend_pid', '=', backend_pid),
+        ], limit=1)
+
+    @api.model
+    def _log_page(self, run_id, page_vals, totals):
+        """Record the metrics of a page and the running totals of the run"""
+        with self.env.registry.cursor() as cr:
+            env = self.env(cr=cr)
+            env['monei.sync.run.page'].sudo().create(dict(page_vals, run_id=run_id))
+            env[self._name].sudo().browse(run_id).write(totals)
+
+    @api.model
+    def _finish(self, run_id, vals):
+        """Close the run with its final counters, or its error"""
+        with self.env.registry.cursor() as cr:
+            run = self.env(cr=cr)[self._name].sudo().browse(run_id)
+            run.write(dict(vals, end_date=fields.Datetime.now()))
+
+    @api.model
+    def _attach_profile(self, run_id, report, path):
+        """Store the profiling report of the run (see utils/profiling.py)"""
+        with self.env.registry.cursor() as cr:
+            run = self.env(cr=cr)[self._name].sudo().browse(run_id)
+            run.write({'profile_report': report, 'profile_path': path})
+
+
+class MoneiSyncRunPage(models.Model):
+    _name = 'monei.sync.run.page'
+    _description = 'MONEI Sync Run Page'
+    _order = 'run_id, sequence'
+
+    run_id = fields.Many2one('monei.sync.run', string='Sync Run', required=True, ondelete='cascade', index=True)
+    sequence = fields.Integer(string='Page', readonly=True)
+    offset = fields.Integer(string='Offset', readonly=True)
+    page_size = fields.Integer(string='Page Size', readonly=True)
+    rows = fields.Integer(string='Rows', readonly=True)
+    api_duration = fields.Float(string='API Time (s)', readonly=True, aggregator='avg')
+    processing_duration = fields.Float(string='Processing Time (s)', readonly=True, aggregator='avg')
+    query_count = fields.Integer(string='SQL Queries', readonly=True)
+    rows_per_second = fields.Float(string='Rows/s', readonly=True, aggregator='avg')
@@ -1,8 +1,15 @@
+import hashlib
+import time
+
 from odoo import fields, models, api
+from odoo.tools import ormcache
 from ..graphql.queries import PAYMENT_METHODS_QUERY
 from ..services.api_service import MoneiAPIService
 
-class MoneiPaymentMethod(models.TransientModel):
+# Default seconds during which the available payment methods are reused
+PAYMENT_METHODS_TTL = 3600
+
+class MoneiPaymentMethod(models.Model):
     _name = 'monei.payment.method'
     _description = 'MONEI Payment Method'
     _rec_name = 'display_name'
@@ -10,8 +17,17 @@ class MoneiPaymentMethod(models.TransientModel):
     code = fields.Char(string='Code', readonly=True)
     configured = fields.Boolean(string='Configured', readonly=True)
     enabled = fields.Boolean(string='Enabled', readonly=True)
+    active = fields.Boolean(string='Active', default=True, readonly=True)
+    company_id = fields.Many2one(
+        'res.company', string='Company', required=True, readonly=True, index=True,
+        default=lambda self: self.env.company,
+    )
     display_name = fields.Char(compute='_compute_display_name', store=True)
 
+    _sql_constraints = [
+        ('code_company_unique', 'unique(code, company_id)', 'A payment method can only be added once per company.'),
+    ]
+
     @api.depends('code')
     def _compute_display_name(self):
         """Convert payment method code to display name"""
@@ -31,22 +47,56 @@ class MoneiPaymentMethod(models.TransientModel):
             method.display_name = method_names.get(method.code, method.code.replace('_', ' ').title())
 
     @api.model
-    def get_payment_methods(self):
-        """Fetch payment methods from MONEI API"""
-        api_service = MoneiAPIService(self.env)
+    @ormcache('company_id', 'key_digest', 'period')
+    def _fetch_available_methods(self, company_id, key_digest, period):
+        """Payment methods of the company's account as (code, configured, enabled)
+
+        Cached per registry and API key (key_digest) for the TTL period, see
+        get_payment_methods. A new API key is fetched right away, other
+        changes of the account show up after the TTL.
+        """
+        api_service = MoneiAPIService(self.env, company=self.env['res.company'].browse(company_id))
         response = api_service.execute_query(PAYMENT_METHODS_QUERY)
-        
-        self.search([]).unlink()  # Clear existing records
-        
-        payment_methods = self.env['monei.payment.method']  # Empty recordset
-        if response.get('data', {}).get('availablePaymentMethods'):
-            for method in response['data']['availablePaymentMethods']:
-                # Only create records for configured and enabled methods
-                if method.get('configured') and method.get('enabled'):
-                    payment_methods |= self.create({
-                        'code': method['paymentMethod'],
-                        'configured': method['configured'],
-                        'enabled': method['enabled'],
-                    })
-        
-        return payment_methods  # Return recordset instead of list 
\ No newline at end of file
+        return tuple(
+            (method['paymentMethod'], bool(method.get('configured')), bool(method.get('enabled')))
+            for method in response.get('data', {}).get('availablePaymentMethods') or []
+        )
+
+    @api.model
+    def get_payment_methods(self):
+        """Configured and enabled payment methods of the current company
+
+        The API is called at most once per monei.payment_methods_ttl seconds
+        and worker. The records are kept and updated in place, methods no
+        longer available are archived.
+        """
+        company = self.env.company
+        ttl = int(self.env['ir.config_parameter'].sudo().get_param('monei.payment_methods_ttl') or PAYMENT_METHODS_TTL)
+        key_digest = hashlib.sha256(MoneiAPIService(self.env)._get_api_key().encode()).hexdigest()
+        available = self._fetch_available_methods(company.id, key_digest, int(time.time() // max(ttl, 1)))
+
+        Method = self.sudo().with_context(active_test=False)
+        existing = {method.code: method for method in Method.search([('company_id', '=', company.id)])}
+        method_ids = []
+        new_vals = []
+        for code, configured, enabled in available:
+            vals = {
+                'configured': configured,
+                'enabled': enabled,
+                'active': configured and enabled,
+            }
+            method = existing.pop(code, None)
+            if method is None:
+                new_vals.append(dict(vals, code=code, company_id=company.id))
+                continue
+            if any(method[fname] != value for fname, value in vals.items()):
+                method.write(vals)
+            if method.active:
+                method_ids.append(method.id)
+        if new_vals:
+            method_ids += Method.create(new_vals).filtered('active').ids
+        # No longer offered by the account
+        stale = Method.browse(method.id for method in existing.values() if method.active)
+        if stale:
+            stale.write({'active': False})
+        return self.browse(method_ids)
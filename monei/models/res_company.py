@@ -0,0 +1,25 @@
+from odoo import fields, models
+
+
+class ResCompany(models.Model):
+    _inherit = 'res.company'
+
+    monei_api_key = fields.Char(
+        string='MONEI API Key',
+        groups='base.group_system',
+        help="API key of the company's MONEI account. Companies without their own key use the global MONEI API key."
+    )
+    monei_stores_refreshed_at = fields.Datetime(
+        string='MONEI Stores Refreshed At',
+        readonly=True,
+        help="Last time the MONEI store directory of the company was fetched, see monei.store"
+    )
+
+    def write(self, vals):
+        # Another account has other stores, and the cached service
+        # configuration and payment methods belong to the previous key
+        if 'monei_api_key' not in vals:
+            return super().write(vals)
+        res = super().write(dict(vals, monei_stores_refreshed_at=False))
+        self.env.registry.clear_cache()
+        return res
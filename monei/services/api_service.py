@@ -1,73 +1,244 @@
 from odoo import _, modules
 from odoo.exceptions import UserError
+from collections import namedtuple
+from functools import lru_cache
 import requests
-import json
+import time
+from urllib3.exceptions import ReadTimeoutError
+
+from . import json_codec, metrics, streaming
+
+# Retries of rate limited (429) requests
+MAX_RETRIES = 2
+RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 10.0
+
+# Default seconds to wait for the connection and between two received bytes
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+
+
+class MoneiAPITimeout(UserError):
+    """The MONEI API did not answer in time"""
+
+
+# Configuration of the services of a company, built by
+# res.config.settings._get_monei_service_config and cached per registry
+ServiceConfig = namedtuple('ServiceConfig', ['graphql_url', 'dashboard_url', 'api_key', 'timeout'])
+
+
+@lru_cache(maxsize=1)
+def get_module_version():
+    """Version of the module without the Odoo version prefix
+    (e.g. "18.0.1.0.0" -> "1.0.0")"""
+    version = modules.get_manifest('monei').get('version', '0.0.0')
+    return '.'.join(version.split('.')[-3:])
+
 
 class MoneiAPIService:
-    def __init__(self, env):
+    def __init__(self, env, company=None):
         self.env = env
+        # Company whose MONEI account is used, the current company by default
+        self.company = company or env.company
+        # URLs, API key and timeouts, only read from the database when the
+        # settings changed
+        self.config = env['res.config.settings']._get_monei_service_config(self.company.id)
+        self._request_target = None
+        # Size of the last response, used to adapt the page size of the syncs
+        self.last_response_bytes = 0
         # Get the mixin model to use its logging methods
         self.mixin = self.env['monei.mixin']
-        # Get module version from manifest, removing Odoo version prefix if present
-        manifest = modules.get_manifest('monei')
-        version = manifest.get('version', '0.0.0')
-        # Remove Odoo version prefix if present (e.g., "18.0.1.0.0" -> "1.0.0")
-        self.version = version.split('.')[-3:] if len(version.split('.')) > 3 else version
-        self.version = '.'.join(str(x) for x in self.version)
+        self.version = get_module_version()
 
     def _get_api_url(self, subdomain='graphql'):
         """Get API URL with specified subdomain"""
+        if subdomain == 'graphql':
+            return self.config.graphql_url
+        if subdomain == 'dashboard':
+            return self.config.dashboard_url
         return self.env['res.config.settings']._get_api_url(subdomain)
 
     def _get_payment_url(self, payment_id):
         """Get payment dashboard URL"""
-        base_url = self._get_api_url('dashboard')
-        return f"{base_url}/payments/{payment_id}"
+        return f"{self.config.dashboard_url}/payments/{payment_id}"
 
     def _get_api_key(self):
-        api_key = self.env['ir.config_parameter'].sudo().get_param('monei.api_key')
-        if not api_key:
+        """API key of the company's account, or the global one"""
+        if not self.config.api_key:
             raise UserError(_('Please configure MONEI API Key first'))
-        return api_key
+        return self.config.api_key
+
+    def _get_headers(self):
+        return {
+            'Authorization': f'Bearer {self._get_api_key()}',
+            'Content-Type': 'application/json',
+            'User-Agent': f'MONEI/Odoo/{self.version}'
+        }
+
+    def _get_timeout(self):
+        """(connect, read) timeouts, see monei.connect_timeout and monei.read_timeout"""
+        return self.config.timeout
+
+    def _get_request_target(self):
+        """URL, headers and timeouts of the API calls
 
-    def _make_request(self, data):
-        """Make a request to the MONEI API"""
+        Resolved once per service, after which the service can send requests
+        from threads that must not use the environment.
+        """
+        if self._request_target is None:
+            self._request_target = (self._get_api_url(), self._get_headers(), self._get_timeout())
+        return self._request_target
+
+    def _post(self, body, call, stream=False, timeout=None):
+        """Send a request body, resending it while it is rate limited
+
+        The HTTP status, retries and bytes received so far are collected in
+        the call dict for the metrics.
+        """
+        url, headers, default_timeout = self._get_request_target()
+        while True:
+            try:
+                response = requests.post(
+                    url,
+                    headers=headers,
+                    data=body,
+                    timeout=timeout or default_timeout,
+                    stream=stream,
+                )
+            except requests.exceptions.ConnectionError as e:
+                # A read timeout during the body is reported as a connection error
+                if e.args and isinstance(e.args[0], ReadTimeoutError):
+                    raise requests.exceptions.ReadTimeout(e) from e
+                raise
+            call['status'] = response.status_code
+            # Rate limited requests are not processed, so they are safe to resend
+            if response.status_code != 429 or call['retries'] >= MAX_RETRIES:
+                return response
+            call['response_bytes'] += len(response.content)
+            call['retries'] += 1
+            time.sleep(self._get_retry_delay(response, call['retries']))
+
+    def _make_request(self, data, timeout=None):
+        """Make a request to the MONEI API
+
+        Every call is recorded in the metrics registry (see metrics.py) with
+        its operation name, duration, payload sizes, HTTP status and retries.
+        timeout overrides the configured (connect, read) timeouts.
+        """
+        operation = metrics.get_operation_name(data.get('query'))
+        body = json_codec.dumps(data)
+        call = {'status': None, 'retries': 0, 'response_bytes': 0}
+        error = 'other'
+        start = time.monotonic()
         try:
-            self.mixin._log_debug(f"Making API request:\n{json.dumps(data, indent=2)}")
-
-            response = requests.post(
-                self._get_api_url(),
-                headers={
-                    'Authorization': f'Bearer {self._get_api_key()}',
-                    'Content-Type': 'application/json',
-                    'User-Agent': f'MONEI/Odoo/{self.version}'
-                },
-                json=data,
-                timeout=30
-            )
-            
-            response_data = response.json()
-            
+            if self.mixin._is_debug_enabled():
+                self.mixin._log_debug(f"Making API request:\n{json_codec.dumps_pretty(data)}")
+
+            response = self._post(body, call, timeout=timeout)
+            call['response_bytes'] += len(response.content)
+
+            try:
+                response_data = json_codec.loads(response.content)
+            except ValueError:
+                error = 'http'
+                raise
+
             if 'errors' in response_data:
+                error = 'graphql'
                 raise UserError(response_data['errors'][0].get('message', 'Unknown error'))
-                
+
+            error = 'none' if response.ok else 'http'
             return response_data
-            
+
+        except requests.exceptions.Timeout:
+            # Before ConnectionError, which connect timeouts also are
+            error = 'timeout'
+            raise MoneiAPITimeout(_('The request timed out. Please try again. If the issue persists, contact support.'))
         except requests.exceptions.ConnectionError:
+            error = 'connection'
             raise UserError(_('Could not connect to the server. Contact support if the issue persists.'))
-        except requests.exceptions.Timeout:
-            raise UserError(_('The request timed out. Please try again. If the issue persists, contact support.'))
         except Exception as e:
             self.mixin._log_error(f'API request failed: {e}')
             raise UserError(_('API request failed: %s') % str(e))
+        finally:
+            self.last_response_bytes = call['response_bytes']
+            metrics.registry.record_request(
+                operation, call['status'], error, time.monotonic() - start,
+                len(body) * (call['retries'] + 1), call['response_bytes'], call['retries'],
+            )
+
+    def stream_query(self, query, items_path, value_paths=(), variables=None, timeout=None):
+        """Execute a GraphQL query and stream the items of a list of its response
 
-    def execute_query(self, query, variables=None):
+        Returns a streaming.ItemStream yielding the items of items_path as
+        the body is downloaded. The values of value_paths and the GraphQL
+        errors are available once the stream is consumed, the call is
+        recorded in the metrics registry when it is closed.
+        """
+        data = {
+            'query': query,
+            'variables': variables or {}
+        }
+        operation = metrics.get_operation_name(query)
+        body = json_codec.dumps(data)
+        call = {'status': None, 'retries': 0, 'response_bytes': 0}
+        start = time.monotonic()
+
+        def record(error):
+            metrics.registry.record_request(
+                operation, call['status'], error, time.monotonic() - start,
+                len(body) * (call['retries'] + 1), call['response_bytes'], call['retries'],
+            )
+
+        if self.mixin._is_debug_enabled():
+            self.mixin._log_debug(f"Making streamed API request:\n{json_codec.dumps_pretty(data)}")
+        try:
+            response = self._post(body, call, stream=True, timeout=timeout)
+        except requests.exceptions.Timeout:
+            record('timeout')
+            raise MoneiAPITimeout(_('The request timed out. Please try again. If the issue persists, contact support.'))
+        except requests.exceptions.ConnectionError:
+            record('connection')
+            raise UserError(_('Could not connect to the server. Contact support if the issue persists.'))
+
+        if not response.ok:
+            # Error answers are small, decode them in one go
+            call['response_bytes'] += len(response.content)
+            record('http')
+            try:
+                message = json_codec.loads(response.content)['errors'][0]['message']
+            except (ValueError, KeyError, IndexError, TypeError):
+                message = f'{response.status_code} {response.reason}'
+            self.mixin._log_error(f'API request failed: {message}')
+            raise UserError(_('API request failed: %s') % message)
+
+        def on_close(stream):
+            call['response_bytes'] += stream.bytes_read
+            self.last_response_bytes = call['response_bytes']
+            if stream.timed_out:
+                record('timeout')
+            elif not stream.completed:
+                record('other')
+            else:
+                record('graphql' if stream.errors else 'none')
+
+        return streaming.ItemStream(response, items_path, value_paths, on_close=on_close)
+
+    def _get_retry_delay(self, response, attempt):
+        """Seconds to wait before resending a rate limited request"""
+        try:
+            delay = float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+        return min(delay, MAX_RETRY_DELAY)
+
+    def execute_query(self, query, variables=None, timeout=None):
         """Execute a GraphQL query"""
         data = {
             'query': query,
             'variables': variables or {}
         }
-        return self._make_request(data)
+        return self._make_request(data, timeout=timeout)
 
     def execute_mutation(self, mutation, variables=None):
         """Execute a GraphQL mutation"""
@@ -98,7 +269,8 @@ class MoneiAPIService:
             }
             """)
         
-            self.mixin._log_debug(f"Test connection response:\n{json.dumps(response, indent=2)}")
+            if self.mixin._is_debug_enabled():
+                self.mixin._log_debug(f"Test connection response:\n{json_codec.dumps_pretty(response)}")
             
             if 'data' in response and 'account' in response['data']:
                 returned_api_key = response['data']['account'].get('apiKey')
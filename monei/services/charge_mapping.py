@@ -0,0 +1,249 @@
+"""Declarative mapping of MONEI charges to monei.payment values
+
+Each entry maps a dotted path of the GraphQL charge to a field, with an
+optional converter applied to non null values and the default used when the
+value is missing or null. A mapping is compiled once into a single function
+which fetches every nested object only once, instead of walking the charge
+again for each field.
+"""
+from datetime import datetime
+from types import MappingProxyType
+
+_EMPTY = MappingProxyType({})
+
+
+def cents(value):
+    """Convert an amount in cents to currency units"""
+    try:
+        return float(value) / 100.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def timestamp(value):
+    """Convert a Unix timestamp to a naive datetime"""
+    if isinstance(value, (int, float)) and value > 0:
+        return datetime.fromtimestamp(value)
+    return False
+
+
+def metadata(value):
+    """Convert the GraphQL metadata key/value list into a JSON object"""
+    return {
+        item['key']: item.get('value')
+        for item in value or []
+        if isinstance(item, dict) and item.get('key')
+    }
+
+
+class ChargeMapping:
+    """Compiled converter of charges (or parts of them) to field values"""
+
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+        self.fields = tuple(entry[0] for entry in self.entries)
+        self._root_by_field = {field: path.split('.')[0] for field, path, _converter, _default in self.entries}
+        self._convert = self._compile()
+
+    def _compile(self):
+        namespace = {'EMPTY': _EMPTY}
+        lines = ['def convert(charge):', '    vals = {}']
+        nodes = {(): 'charge'}
+
+        def node(keys):
+            # Variable holding the nested object at keys, fetched once
+            if keys not in nodes:
+                parent = node(keys[:-1])
+                name = nodes[keys] = f'node{len(nodes)}'
+                lines.append(f'    {name} = {parent}.get({keys[-1]!r})')
+                lines.append(f'    if not isinstance({name}, dict): {name} = EMPTY')
+            return nodes[keys]
+
+        for index, (field, path, converter, default) in enumerate(self.entries):
+            keys = tuple(path.split('.'))
+            parent = node(keys[:-1])
+            namespace[f'default{index}'] = default
+            lines.append(f'    value = {parent}.get({keys[-1]!r})')
+            if converter:
+                namespace[f'convert{index}'] = converter
+                lines.append(f'    vals[{field!r}] = default{index} if value is None else convert{index}(value)')
+            else:
+                lines.append(f'    vals[{field!r}] = default{index} if value is None else value')
+        lines.append('    return vals')
+        exec(compile('\n'.join(lines), '<charge mapping>', 'exec'), namespace)
+        return namespace['convert']
+
+    def to_vals(self, charge, partial=False):
+        """Return the field values of a charge
+
+        Args:
+            charge: Charge dict as returned by the API
+            partial: Only map the fields whose top level key is in the charge,
+                e.g. for mutation responses which select a few fields
+        """
+        vals = self._convert(charge)
+        if partial:
+            return {field: value for field, value in vals.items() if self._root_by_field[field] in charge}
+        return vals
+
+    def subset(self, fields):
+        """Mapping restricted to the given fields"""
+        return ChargeMapping(entry for entry in self.entries if entry[0] in fields)
+
+
+# Core fields, selected by CHARGE_CORE_FIELDS
+CHARGE_CORE_MAPPING = ChargeMapping([
+    ('name', 'id', None, False),
+    ('order_id', 'orderId', None, None),
+    ('checkout_id', 'checkoutId', None, None),
+    ('authorization_code', 'authorizationCode', None, None),
+    ('livemode', 'livemode', None, False),
+
+    ('amount', 'amount', cents, 0.0),
+    ('currency', 'currency', None, ''),
+    ('refunded_amount', 'refundedAmount', cents, 0.0),
+    ('last_refund_amount', 'lastRefundAmount', cents, 0.0),
+    ('last_refund_reason', 'lastRefundReason', None, None),
+
+    ('status', 'status', None, 'PENDING'),
+    ('status_code', 'statusCode', str, ''),
+    ('status_message', 'statusMessage', None, ''),
+    ('cancellation_reason', 'cancellationReason', None, ''),
+
+    ('payment_date', 'createdAt', timestamp, False),
+    ('updated_at', 'updatedAt', timestamp, False),
+    ('page_opened_at', 'pageOpenedAt', timestamp, False),
+
+    ('account_id', 'accountId', None, ''),
+    ('store_ref', 'storeId', None, None),
+    ('subscription_id', 'subscriptionId', None, ''),
+    ('terminal_id', 'terminalId', None, ''),
+    ('provider_id', 'providerId', None, ''),
+    ('provider_internal_id', 'providerInternalId', None, ''),
+    ('provider_reference_id', 'providerReferenceId', None, ''),
+    ('point_of_sale_id', 'pointOfSaleId', None, ''),
+    ('sequence_id', 'sequenceId', None, ''),
+    ('description', 'description', None, ''),
+    ('descriptor', 'descriptor', None, ''),
+    ('customer_name', 'customer.name', None, ''),
+    ('customer_email', 'customer.email', None, ''),
+    ('customer_phone', 'customer.phone', None, ''),
+    ('payment_method', 'paymentMethod.method', None, ''),
+    ('shipping_name', 'shippingDetails.name', None, ''),
+    ('shipping_email', 'shippingDetails.email', None, ''),
+    ('shipping_phone', 'shippingDetails.phone', None, ''),
+    ('shipping_company', 'shippingDetails.company', None, ''),
+    ('shipping_tax_id', 'shippingDetails.taxId', None, ''),
+    ('shipping_street', 'shippingDetails.address.line1', None, ''),
+    ('shipping_street2', 'shippingDetails.address.line2', None, ''),
+    ('shipping_city', 'shippingDetails.address.city', None, ''),
+    ('shipping_state', 'shippingDetails.address.state', None, ''),
+    ('shipping_zip', 'shippingDetails.address.zip', None, ''),
+    ('shipping_country', 'shippingDetails.address.country', None, ''),
+    ('billing_name', 'billingDetails.name', None, ''),
+    ('billing_email', 'billingDetails.email', None, ''),
+    ('billing_phone', 'billingDetails.phone', None, ''),
+    ('billing_company', 'billingDetails.company', None, ''),
+    ('billing_tax_id', 'billingDetails.taxId', None, ''),
+    ('billing_street', 'billingDetails.address.line1', None, ''),
+    ('billing_street2', 'billingDetails.address.line2', None, ''),
+    ('billing_city', 'billingDetails.address.city', None, ''),
+    ('billing_state', 'billingDetails.address.state', None, ''),
+    ('billing_zip', 'billingDetails.address.zip', None, ''),
+    ('billing_country', 'billingDetails.address.country', None, ''),
+
+    # Card details
+    ('card_brand', 'paymentMethod.card.brand', None, None),
+    ('card_last4', 'paymentMethod.card.last4', None, None),
+    ('card_type', 'paymentMethod.card.type', None, None),
+    ('card_country', 'paymentMethod.card.country', None, None),
+    ('cardholder_name', 'paymentMethod.card.cardholderName', None, None),
+    ('cardholder_email', 'paymentMethod.card.cardholderEmail', None, None),
+    ('card_expiration', 'paymentMethod.card.expiration', None, None),
+    ('card_bank', 'paymentMethod.card.bank', None, None),
+    ('tokenization_method', 'paymentMethod.card.tokenizationMethod', None, None),
+    ('three_d_secure', 'paymentMethod.card.threeDSecure', None, None),
+    ('three_d_secure_version', 'paymentMethod.card.threeDSecureVersion', None, None),
+    ('three_d_secure_flow', 'paymentMethod.card.threeDSecureFlow', None, None),
+
+    # Shop details
+    ('shop_name', 'shop.name', None, False),
+    ('shop_country', 'shop.country', None, False),
+
+    # Billing Plan
+    ('billing_plan', 'billingPlan', None, None),
+
+    # Payment Method Type and Details
+    ('payment_method_type', 'paymentMethod.method', None, False),
+
+    # PayPal Details
+    ('paypal_order_id', 'paymentMethod.paypal.orderId', None, False),
+    ('paypal_payer_id', 'paymentMethod.paypal.payerId', None, False),
+    ('paypal_email', 'paymentMethod.paypal.email', None, False),
+    ('paypal_name', 'paymentMethod.paypal.name', None, False),
+
+    # Bizum Details
+    ('bizum_phone', 'paymentMethod.bizum.phoneNumber', None, False),
+    ('bizum_integration_type', 'paymentMethod.bizum.integrationType', None, False),
+
+    # SEPA Details
+    ('sepa_accountholder_name', 'paymentMethod.sepa.accountholderName', None, False),
+    ('sepa_accountholder_email', 'paymentMethod.sepa.accountholderEmail', None, False),
+    ('sepa_country_code', 'paymentMethod.sepa.countryCode', None, False),
+    ('sepa_bank_name', 'paymentMethod.sepa.bankName', None, False),
+    ('sepa_bank_code', 'paymentMethod.sepa.bankCode', None, False),
+    ('sepa_bic', 'paymentMethod.sepa.bic', None, False),
+    ('sepa_last4', 'paymentMethod.sepa.last4', None, False),
+
+    # Klarna Details
+    ('klarna_billing_category', 'paymentMethod.klarna.billingCategory', None, False),
+    ('klarna_auth_payment_method', 'paymentMethod.klarna.authPaymentMethod', None, False),
+])
+
+# Heavy detail blocks, selected by CHARGE_DETAIL_FIELDS and stored in the
+# session companion model
+CHARGE_DETAIL_MAPPING = ChargeMapping([
+    # Session Details
+    ('session_ip', 'sessionDetails.ip', None, False),
+    ('session_user_agent', 'sessionDetails.userAgent', None, False),
+    ('session_country', 'sessionDetails.countryCode', None, False),
+    ('session_lang', 'sessionDetails.lang', None, False),
+    ('session_device_type', 'sessionDetails.deviceType', None, False),
+    ('session_device_model', 'sessionDetails.deviceModel', None, False),
+    ('session_browser', 'sessionDetails.browser', None, False),
+    ('session_browser_version', 'sessionDetails.browserVersion', None, False),
+    ('session_browser_accept', 'sessionDetails.browserAccept', None, False),
+    ('session_browser_color_depth', 'sessionDetails.browserColorDepth', None, False),
+    ('session_browser_screen_height', 'sessionDetails.browserScreenHeight', None, False),
+    ('session_browser_screen_width', 'sessionDetails.browserScreenWidth', None, False),
+    ('session_browser_timezone_offset', 'sessionDetails.browserTimezoneOffset', None, False),
+    ('session_os', 'sessionDetails.os', None, False),
+    ('session_os_version', 'sessionDetails.osVersion', None, False),
+    ('session_source', 'sessionDetails.source', None, False),
+    ('session_source_version', 'sessionDetails.sourceVersion', None, False),
+
+    # Trace Details
+    ('trace_ip', 'traceDetails.ip', None, False),
+    ('trace_user_agent', 'traceDetails.userAgent', None, False),
+    ('trace_country', 'traceDetails.countryCode', None, False),
+    ('trace_lang', 'traceDetails.lang', None, False),
+    ('trace_device_type', 'traceDetails.deviceType', None, False),
+    ('trace_device_model', 'traceDetails.deviceModel', None, False),
+    ('trace_browser', 'traceDetails.browser', None, False),
+    ('trace_browser_version', 'traceDetails.browserVersion', None, False),
+    ('trace_browser_accept', 'traceDetails.browserAccept', None, False),
+    ('trace_os', 'traceDetails.os', None, False),
+    ('trace_os_version', 'traceDetails.osVersion', None, False),
+    ('trace_source', 'traceDetails.source', None, False),
+    ('trace_source_version', 'traceDetails.sourceVersion', None, False),
+    ('trace_user_id', 'traceDetails.userId', None, False),
+    ('trace_user_email', 'traceDetails.userEmail', None, False),
+    ('trace_user_name', 'traceDetails.userName', None, False),
+
+    # Metadata
+    ('metadata', 'metadata', metadata, {}),
+])
+
+# Fields returned by the payment mutations, the payment and its store are
+# already known
+CHARGE_RESPONSE_MAPPING = CHARGE_CORE_MAPPING.subset(set(CHARGE_CORE_MAPPING.fields) - {'name', 'store_ref'})
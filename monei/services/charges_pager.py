@@ -0,0 +1,257 @@
+import queue
+import threading
+import time
+
+from odoo import _
+from odoo.exceptions import UserError
+from odoo.tools import split_every
+
+from .api_service import MoneiAPITimeout
+
+# Seconds between two checks of the stop flag while the queue is full or empty
+POLL_INTERVAL = 0.1
+
+# No new page is requested with less time left before the deadline
+MIN_PAGE_TIME = 1.0
+
+# Largest response aimed at by the page sizer
+MAX_PAGE_BYTES = 16 * 1024 * 1024
+
+ITEMS_PATH = 'data.charges.items'
+TOTAL_PATH = 'data.charges.total'
+
+
+class PageSizer:
+    """Adapt the page size to the observed latency and payload size
+
+    After each page the size is set so that the next page takes about
+    target_duration seconds and at most MAX_PAGE_BYTES, without more than
+    doubling it, within [min_size, max_size]. Timed out pages halve it.
+    """
+
+    def __init__(self, size, min_size, max_size, target_duration):
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.size = min(max(size, self.min_size), self.max_size)
+        self.target_duration = target_duration
+
+    def observe(self, rows, duration, response_bytes):
+        if not rows:
+            return
+        size = self.target_duration * rows / max(duration, 0.001)
+        if response_bytes:
+            size = min(size, MAX_PAGE_BYTES * rows / response_bytes)
+        self.size = int(max(self.min_size, min(self.max_size, 2 * self.size, size)))
+
+    def shrink(self):
+        """Halve the size, False if it already is the minimum"""
+        if self.size <= self.min_size:
+            return False
+        self.size = max(self.min_size, self.size // 2)
+        return True
+
+
+class ChargesPage:
+    """A page of charges, iterating over it yields its items in chunks
+
+    rows and total are set once the page is consumed.
+    """
+
+    def __init__(self, pager, offset, size):
+        self.pager = pager
+        self.offset = offset
+        self.size = size
+        self.rows = 0
+        self.total = 0
+
+    def __iter__(self):
+        while True:
+            kind, value = self.pager._next_event()
+            if kind == 'chunk':
+                yield value
+            elif kind == 'end':
+                self.rows, self.total = value
+                return
+            elif kind == 'error':
+                raise value
+
+
+class ChargesPager:
+    """Fetch the pages of the charges list, optionally ahead of their processing
+
+    With prefetch pages, a background thread fetches the next pages into a
+    bounded queue while the caller processes the current one, so the API
+    and database times overlap. The thread only does HTTP: the queries are
+    built by build_query, which must not use the environment, and the
+    service resolves its URL, headers and timeouts before the thread starts.
+
+    The page size adapts to the API (see PageSizer). A timed out page is
+    requested again with a smaller size, and a page whose body stopped
+    midway is resumed after its last complete item. Once the deadline
+    passes no more pages are fetched and deadline_reached is set.
+
+    Args:
+        api_service: MoneiAPIService of the synced account
+        build_query: function returning the query of the page at an offset and of a size
+        sizer: PageSizer giving the size of the pages
+        prefetch: number of pages fetched ahead, 0 to fetch in the caller's thread
+        stream: parse the pages while they download (see streaming.py)
+        chunk_size: number of charges per chunk when streaming
+        deadline: time.monotonic() value after which no page is fetched
+    """
+
+    def __init__(self, api_service, build_query, sizer, prefetch=0, stream=False, chunk_size=200, deadline=None):
+        self.api_service = api_service
+        self.build_query = build_query
+        self.sizer = sizer
+        self.prefetch = prefetch
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.deadline = deadline
+        self.deadline_reached = False
+        self.timeout = api_service._get_request_target()[2]
+        chunks_per_page = -(-sizer.max_size // chunk_size) if stream else 1
+        # Page start and end markers included
+        self._queue = queue.Queue(maxsize=max(1, prefetch) * (chunks_per_page + 2))
+        self._stop = threading.Event()
+        self._events = None
+        self._thread = None
+
+    def __enter__(self):
+        self._events = self._fetch_events()
+        if self.prefetch:
+            self._thread = threading.Thread(target=self._run, name='monei-charges-pager', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        if self._thread:
+            # Unblock the fetcher if it waits on a full queue
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    pass
+            self._thread.join()
+        else:
+            self._events.close()
+
+    def __iter__(self):
+        while True:
+            kind, value = self._next_event()
+            if kind == 'page':
+                yield ChargesPage(self, *value)
+            elif kind == 'error':
+                raise value
+            elif kind == 'done':
+                return
+
+    def _get_page_timeout(self):
+        """(connect, read) timeouts of the next page, None past the deadline"""
+        if self.deadline is None:
+            return self.timeout
+        remaining = self.deadline - time.monotonic()
+        if remaining < MIN_PAGE_TIME:
+            return None
+        connect, read = self.timeout
+        return min(connect, remaining), min(read, remaining)
+
+    def _fetch_events(self):
+        """Fetch the pages and generate their page, chunk and end events"""
+        offset = 0
+        total = None
+        while True:
+            timeout = self._get_page_timeout()
+            if timeout is None:
+                self.deadline_reached = True
+                break
+            size = self.sizer.size
+            query = self.build_query(offset, size)
+            # Time spent fetching the page, not the one spent processing it
+            start = time.perf_counter()
+            try:
+                if self.stream:
+                    stream = self.api_service.stream_query(query, ITEMS_PATH, [TOTAL_PATH], timeout=timeout)
+                else:
+                    response_data = self.api_service.execute_query(query, timeout=timeout)
+            except MoneiAPITimeout:
+                if not self.sizer.shrink():
+                    raise
+                continue
+            duration = time.perf_counter() - start
+            yield 'page', (offset, size)
+
+            rows = 0
+            if self.stream:
+                try:
+                    chunks = split_every(self.chunk_size, stream, list)
+                    while True:
+                        chunk_start = time.perf_counter()
+                        chunk = next(chunks, None)
+                        duration += time.perf_counter() - chunk_start
+                        if chunk is None:
+                            break
+                        rows += len(chunk)
+                        yield 'chunk', chunk
+                        if self.deadline is not None and time.monotonic() >= self.deadline:
+                            self.deadline_reached = True
+                            break
+                finally:
+                    stream.close()
+                if stream.errors:
+                    raise UserError(stream.errors[0])
+                total = stream.values.get(TOTAL_PATH, total)
+                timed_out = stream.timed_out
+            else:
+                charges = (response_data.get('data') or {}).get('charges') or {}
+                items = charges.get('items') or []
+                total = charges.get('total', total)
+                rows = len(items)
+                timed_out = False
+                yield 'chunk', items
+            yield 'end', (rows, total or 0)
+
+            if self.deadline_reached:
+                break
+            if timed_out:
+                # The items received are complete, resume after them
+                if not self.sizer.shrink() and not rows:
+                    raise MoneiAPITimeout(_('The request timed out. Please try again. If the issue persists, contact support.'))
+            else:
+                self.sizer.observe(rows, duration, self.api_service.last_response_bytes)
+                # If we got a full page, there might be more
+                if rows < size or offset + rows >= (total or 0):
+                    break
+            offset += rows
+        yield 'done', None
+
+    def _next_event(self):
+        if not self._thread:
+            return next(self._events)
+        while True:
+            try:
+                return self._queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not self._thread.is_alive() and self._queue.empty():
+                    return 'error', RuntimeError('The charges fetcher stopped unexpectedly')
+
+    def _run(self):
+        try:
+            for event in self._events:
+                if not self._put(event):
+                    return
+        except Exception as e:
+            self._put(('error', e))
+        finally:
+            self._events.close()
+
+    def _put(self, event):
+        """Queue an event, False if the pager was closed in the meantime"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(event, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
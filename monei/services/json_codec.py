@@ -0,0 +1,40 @@
+"""JSON encoding and decoding of the API payloads
+
+Uses orjson when it is installed, which decodes large charge pages several
+times faster, and the standard library json module otherwise. Encoders
+return bytes, decoders accept bytes or str.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Decode a JSON document, raises ValueError when it is invalid"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value):
+    """Encode value as compact JSON"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def dumps_canonical(value):
+    """Encode value with sorted keys, unknown types as str, e.g. for hashing"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str).encode()
+
+
+def dumps_pretty(value):
+    """Encode value indented for logs, returns str"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,193 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Minimum delay between two snapshot writes of the same worker
+SNAPSHOT_INTERVAL = 5.0
+
+OPERATION_RE = re.compile(r'\b(query|mutation)\b\s*(\w+)?[^{]*\{\s*(\w+)')
+
+METRICS_HELP = {
+    'monei_api_requests_total': ('counter', 'MONEI API calls by operation, HTTP status and error class'),
+    'monei_api_request_duration_seconds': ('histogram', 'MONEI API call duration, retries included'),
+    'monei_api_request_bytes_total': ('counter', 'Bytes sent to the MONEI API'),
+    'monei_api_response_bytes_total': ('counter', 'Bytes received from the MONEI API'),
+    'monei_api_retries_total': ('counter', 'MONEI API calls retried after a 429 answer'),
+}
+
+
+def get_operation_name(query):
+    """Name of the GraphQL operation, or its first root field when unnamed"""
+    match = OPERATION_RE.search(query or '')
+    if not match:
+        return 'unknown'
+    return match.group(2) or match.group(3)
+
+
+class MetricsRegistry:
+    """In-process counters and histograms of the MONEI API calls
+
+    Odoo runs several worker processes, so every worker periodically dumps
+    its registry to a snapshot file in the data directory and the metrics
+    endpoint sums the snapshots of all workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._last_snapshot = 0.0
+
+    def _inc(self, name, labels, value=1):
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, name, labels, value):
+        key = (name, labels)
+        buckets = self._histograms.get(key)
+        if buckets is None:
+            # One counter per bucket, then +Inf, sum and count
+            buckets = self._histograms[key] = [0] * (len(DURATION_BUCKETS) + 3)
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                buckets[index] += 1
+        buckets[-3] += 1
+        buckets[-2] += value
+        buckets[-1] += 1
+
+    def record_request(self, operation, status, error, duration, request_bytes, response_bytes, retries):
+        """Record a finished API call
+
+        Args:
+            operation: GraphQL operation name
+            status: HTTP status of the last attempt, None when no response was received
+            error: Error class ('none', 'http', 'graphql', 'timeout', 'connection' or 'other')
+            duration: Duration in seconds, retries included
+            request_bytes: Size of the request body
+            response_bytes: Size of the response body
+            retries: Number of retried attempts
+        """
+        operation_label = (('operation', operation),)
+        with self._lock:
+            self._inc('monei_api_requests_total', operation_label + (
+                ('status', str(status or 0)),
+                ('error', error),
+            ))
+            self._observe('monei_api_request_duration_seconds', operation_label, duration)
+            self._inc('monei_api_request_bytes_total', operation_label, request_bytes)
+            self._inc('monei_api_response_bytes_total', operation_label, response_bytes)
+            if retries:
+                self._inc('monei_api_retries_total', operation_label, retries)
+        self._maybe_write_snapshot()
+
+    def snapshot(self):
+        """Return the registry as a JSON serializable dict"""
+        with self._lock:
+            return {
+                'counters': [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                'histograms': [[name, list(labels), list(buckets)] for (name, labels), buckets in self._histograms.items()],
+            }
+
+    def _maybe_write_snapshot(self):
+        now = time.monotonic()
+        if now - self._last_snapshot < SNAPSHOT_INTERVAL:
+            return
+        self._last_snapshot = now
+        self.write_snapshot()
+
+    def write_snapshot(self):
+        """Dump this worker's registry to its snapshot file"""
+        directory = get_snapshot_dir()
+        path = os.path.join(directory, f'{os.getpid()}.json')
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w') as snapshot_file:
+                json.dump(self.snapshot(), snapshot_file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _logger.warning('Could not write MONEI metrics snapshot %s: %s', path, e)
+
+
+def get_snapshot_dir():
+    return os.path.join(config['data_dir'], 'monei_metrics', config['db_name'] or 'default')
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect():
+    """Sum the snapshots of all live workers, including this one"""
+    registry.write_snapshot()
+    directory = get_snapshot_dir()
+    counters, histograms = {}, {}
+    for filename in os.listdir(directory) if os.path.isdir(directory) else []:
+        if not filename.endswith('.json'):
+            continue
+        path = os.path.join(directory, filename)
+        pid = filename[:-len('.json')]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            # Recycled worker, its counters are gone with it
+            os.unlink(path)
+            continue
+        try:
+            with open(path) as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (OSError, ValueError):
+            continue
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, buckets in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, [0] * len(buckets))
+            for index, value in enumerate(buckets):
+                merged[index] += value
+    return counters, histograms
+
+
+def _format_labels(labels):
+    return ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"')) for name, value in labels)
+
+
+def render_prometheus():
+    """Render the metrics of all workers in the Prometheus text format"""
+    counters, histograms = collect()
+    lines = []
+    for name, (metric_type, help_text) in METRICS_HELP.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        if metric_type == 'histogram':
+            for (metric, labels), buckets in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, value in zip(DURATION_BUCKETS, buckets):
+                    lines.append(f'{name}_bucket{{{_format_labels(labels + (("le", bound),))}}} {value}')
+                lines.append(f'{name}_bucket{{{_format_labels(labels + (("le", "+Inf"),))}}} {buckets[-3]}')
+                lines.append(f'{name}_sum{{{_format_labels(labels)}}} {buckets[-2]}')
+                lines.append(f'{name}_count{{{_format_labels(labels)}}} {buckets[-1]}')
+        else:
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{{{_format_labels(labels)}}} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
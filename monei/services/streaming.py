@@ -0,0 +1,95 @@
+"""Incremental parsing of large GraphQL responses
+
+The items of a list in the response (e.g. data.charges.items) are parsed
+one by one while the body is downloaded, instead of decoding the whole page
+first. Requires the optional ijson package.
+"""
+from urllib3.exceptions import ReadTimeoutError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+SCALAR_EVENTS = ('null', 'boolean', 'integer', 'double', 'number', 'string')
+
+
+def is_available():
+    return ijson is not None
+
+
+class ItemStream:
+    """Iterate over the items of a list of a streamed JSON response
+
+    Scalar values found at the prefixes given in ``value_paths`` (e.g.
+    'data.charges.total') and the GraphQL error messages are collected while
+    iterating, they are complete once the iteration is over. When the server
+    stops sending during the body, the iteration ends early with timed_out
+    set, the items yielded until then are complete.
+
+    Args:
+        response: requests response opened with stream=True
+        items_path: dotted path of the list, e.g. 'data.charges.items'
+        value_paths: dotted paths of the scalar values to collect
+        on_close: called with the stream once the body is consumed or the
+            iteration is abandoned
+    """
+
+    def __init__(self, response, items_path, value_paths=(), on_close=None):
+        self.response = response
+        self.item_prefix = f'{items_path}.item'
+        self.value_paths = frozenset(value_paths)
+        self.values = {}
+        self.errors = []
+        self.item_count = 0
+        self.on_close = on_close
+        self.completed = False
+        self.timed_out = False
+        self.closed = False
+
+    @property
+    def bytes_read(self):
+        return self.response.raw.tell()
+
+    def __iter__(self):
+        # Let urllib3 undo a gzip content encoding
+        self.response.raw.decode_content = True
+        builder = None
+        depth = 0
+        try:
+            for prefix, event, value in ijson.parse(self.response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event in ('start_map', 'start_array'):
+                        depth += 1
+                    elif event in ('end_map', 'end_array'):
+                        depth -= 1
+                        if not depth:
+                            self.item_count += 1
+                            yield builder.value
+                            builder = None
+                elif prefix == self.item_prefix:
+                    if event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        depth = 1
+                    elif event in SCALAR_EVENTS:
+                        self.item_count += 1
+                        yield value
+                elif prefix in self.value_paths and event in SCALAR_EVENTS:
+                    self.values[prefix] = value
+                elif prefix == 'errors.item.message' and event == 'string':
+                    self.errors.append(value)
+            self.completed = True
+        except ReadTimeoutError:
+            self.timed_out = True
+        finally:
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.response.close()
+        if self.on_close:
+            self.on_close(self)
@@ -0,0 +1,128 @@
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+# Number of functions and SQL queries listed in the reports
+TOP_FUNCTIONS = 40
+TOP_QUERIES = 20
+
+_local = threading.local()
+
+
+def is_profiling_enabled(env):
+    """Profiling is enabled by the monei_profile context key or the monei.profiling system parameter"""
+    if env.context.get('monei_profile'):
+        return True
+    return bool(env['ir.config_parameter'].sudo().get_param('monei.profiling'))
+
+
+def get_current_session():
+    """Return the profiling session running in this thread, if any"""
+    return getattr(_local, 'session', None)
+
+
+class ProfileSession:
+    """cProfile run with the timing of every SQL query executed by the thread"""
+
+    def __init__(self, label):
+        self.label = label
+        self.profiler = cProfile.Profile()
+        self.queries = {}
+        self.query_count = 0
+        self.query_time = 0.0
+        self.duration = 0.0
+        self.sync_run_id = None
+
+    def _query_hook(self, cr, query, params, start, delay, *args):
+        # Group the queries by statement, whitespace collapsed
+        statement = re.sub(r'\s+', ' ', getattr(query, 'code', query) or '').strip()[:300]
+        count, total = self.queries.get(statement, (0, 0.0))
+        self.queries[statement] = (count + 1, total + delay)
+        self.query_count += 1
+        self.query_time += delay
+
+    def __enter__(self):
+        thread = threading.current_thread()
+        if not hasattr(thread, 'query_hooks'):
+            thread.query_hooks = []
+        thread.query_hooks.append(self._query_hook)
+        _local.session = self
+        self._start = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.disable()
+        self.duration = time.perf_counter() - self._start
+        _local.session = None
+        threading.current_thread().query_hooks.remove(self._query_hook)
+
+    def report(self):
+        """Return the hot functions and SQL statements as text"""
+        stream = io.StringIO()
+        stream.write(
+            f'{self.label}: {self.duration:.3f}s, {self.query_count} SQL queries '
+            f'in {self.query_time:.3f}s\n\n'
+        )
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        stream.write(f'\nTop {TOP_QUERIES} SQL statements by total time\n\n')
+        stream.write(f"{'count':>8}{'total s':>10}{'avg ms':>10}  statement\n")
+        statements = sorted(self.queries.items(), key=lambda item: item[1][1], reverse=True)
+        for statement, (count, total) in statements[:TOP_QUERIES]:
+            stream.write(f'{count:>8}{total:>10.3f}{total / count * 1000:>10.2f}  {statement}\n')
+        return stream.getvalue()
+
+    def save(self, env):
+        """Write the profile and its report to the data directory
+
+        The .prof file can be opened with pstats, snakeviz or similar tools.
+        Returns the path of the report.
+        """
+        directory = os.path.join(config['data_dir'], 'monei_profiles', env.cr.dbname)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self.label}"
+        os.makedirs(directory, exist_ok=True)
+        self.profiler.dump_stats(os.path.join(directory, f'{name}.prof'))
+        report_path = os.path.join(directory, f'{name}.txt')
+        with open(report_path, 'w') as report_file:
+            report_file.write(self.report())
+        return report_path
+
+
+def profiled(label):
+    """Profile the decorated model method when profiling is enabled
+
+    Nested profiled calls are part of the outermost profile. The report is
+    written to the data directory and, for a sync, attached to its sync run.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if get_current_session() or not is_profiling_enabled(self.env):
+                return method(self, *args, **kwargs)
+            session = ProfileSession(label)
+            try:
+                with session:
+                    return method(self, *args, **kwargs)
+            finally:
+                try:
+                    report_path = session.save(self.env)
+                    _logger.info('MONEI profile of %s written to %s', label, report_path)
+                    if session.sync_run_id:
+                        self.env['monei.sync.run']._attach_profile(
+                            session.sync_run_id, session.report(), report_path,
+                        )
+                except Exception as e:
+                    _logger.warning('Could not save the MONEI profile of %s: %s', label, e)
+        return wrapper
+    return decorator
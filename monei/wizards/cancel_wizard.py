@@ -2,6 +2,8 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from ..graphql.mutations import CANCEL_PAYMENT_MUTATION
 from ..services.api_service import MoneiAPIService
+from ..services.charge_mapping import CHARGE_RESPONSE_MAPPING
+from ..utils.profiling import profiled
 
 class MoneiPaymentCancelWizard(models.TransientModel):
     _name = 'monei.payment.cancel.wizard'
@@ -16,9 +18,10 @@ class MoneiPaymentCancelWizard(models.TransientModel):
         ('order_canceled', 'Order Canceled')
     ], string='Reason')
 
+    @profiled('cancel_wizard')
     def action_cancel(self):
         self.ensure_one()
-        api_service = MoneiAPIService(self.env)
+        api_service = MoneiAPIService(self.env, company=self.payment_id.company_id)
         
         variables = {
             'input': {
@@ -34,17 +37,7 @@ class MoneiPaymentCancelWizard(models.TransientModel):
             response = api_service.execute_mutation(CANCEL_PAYMENT_MUTATION, variables)
             if response.get('data', {}).get('cancelPayment'):
                 result = response['data']['cancelPayment']
-                
-                # Safe handling of updatedAt
-                updated_at = result.get('updatedAt')
-                
-                self.payment_id.write({
-                    'status': result.get('status'),
-                    'status_code': result.get('statusCode', ''),
-                    'status_message': result.get('statusMessage', ''),
-                    'cancellation_reason': result.get('cancellationReason'),
-                    'updated_at': self._parse_datetime(updated_at) if updated_at else False,
-                })
+                self.payment_id.write(CHARGE_RESPONSE_MAPPING.to_vals(result, partial=True))
                 return {
                     'type': 'ir.actions.act_window',
                     'res_model': 'monei.payment',
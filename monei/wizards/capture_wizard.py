@@ -2,6 +2,8 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from ..graphql.mutations import CAPTURE_PAYMENT_MUTATION
 from ..services.api_service import MoneiAPIService
+from ..services.charge_mapping import CHARGE_RESPONSE_MAPPING
+from ..utils.profiling import profiled
 
 class MoneiPaymentCaptureWizard(models.TransientModel):
     _name = 'monei.payment.capture.wizard'
@@ -20,10 +22,11 @@ class MoneiPaymentCaptureWizard(models.TransientModel):
             if wizard.amount and wizard.amount > wizard.payment_id.amount:
                 raise UserError(_('Cannot capture more than the authorized amount'))
 
+    @profiled('capture_wizard')
     def action_capture(self):
         self.ensure_one()
         
-        api_service = MoneiAPIService(self.env)
+        api_service = MoneiAPIService(self.env, company=self.payment_id.company_id)
         variables = {
             'input': {
                 'paymentId': self.payment_id.name,
@@ -40,17 +43,8 @@ class MoneiPaymentCaptureWizard(models.TransientModel):
             
             self._log_info(f"Capture response: {result}")
             
-            # Safe conversion for amount
-            captured_amount = result.get('amount')
-            updated_at = result.get('updatedAt')
-            
-            self.payment_id.write({
-                'status': result.get('status'),
-                'status_code': result.get('statusCode', ''),
-                'status_message': result.get('statusMessage', ''),
-                'captured_amount': float(captured_amount) / 100 if captured_amount is not None else 0,
-                'updated_at': self._parse_datetime(updated_at) if updated_at else False,
-            })
+            # The amount of the response is the captured one
+            self.payment_id.write(CHARGE_RESPONSE_MAPPING.to_vals(result, partial=True))
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -2,6 +2,7 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from ..graphql.mutations import CREATE_PAYMENT_MUTATION
 from ..services.api_service import MoneiAPIService
+from ..utils.profiling import profiled
 from datetime import datetime, timedelta
 from time import mktime, sleep
 import re
@@ -25,6 +26,7 @@ class MoneiPaymentCreateWizard(models.TransientModel):
     payment_methods = fields.Many2many(
         'monei.payment.method',
         string='Allowed Payment Methods',
+        domain=lambda self: [('company_id', '=', self.env.company.id)],
         required=True
     )
     
@@ -114,6 +116,7 @@ class MoneiPaymentCreateWizard(models.TransientModel):
         sleep(delay)
         return self._wait_for_payment(payment_id, api_service, retries - 1, delay)
 
+    @profiled('create_wizard')
     def action_create(self):
         self.ensure_one()
         
@@ -177,8 +180,8 @@ class MoneiPaymentCreateWizard(models.TransientModel):
                 payment_id = result.get('id')
                 if payment_id:
                     if self._wait_for_payment(payment_id, api_service):
-                        # Payment found, sync all payments
-                        self.env['monei.payment'].action_sync_payments()
+                        # Payment found, sync it
+                        self.env['monei.payment']._sync_payment(payment_id)
                         
                         # Find the created payment record
                         payment = self.env['monei.payment'].search([('name', '=', payment_id)], limit=1)
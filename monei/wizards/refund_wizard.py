@@ -1,5 +1,7 @@
 from ..graphql.mutations import REFUND_PAYMENT_MUTATION
 from ..services.api_service import MoneiAPIService
+from ..services.charge_mapping import CHARGE_RESPONSE_MAPPING
+from ..utils.profiling import profiled
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 
@@ -25,10 +27,11 @@ class MoneiPaymentRefundWizard(models.TransientModel):
             if wizard.amount > (wizard.payment_id.amount - wizard.payment_id.refunded_amount):
                 raise UserError(_('Cannot refund more than the remaining amount'))
 
+    @profiled('refund_wizard')
     def action_refund(self):
         self.ensure_one()
         
-        api_service = MoneiAPIService(self.env)
+        api_service = MoneiAPIService(self.env, company=self.payment_id.company_id)
         variables = {
             'input': {
                 'paymentId': self.payment_id.name,
@@ -43,23 +46,7 @@ class MoneiPaymentRefundWizard(models.TransientModel):
             response = api_service.execute_mutation(REFUND_PAYMENT_MUTATION, variables)
             if response.get('data', {}).get('refundPayment'):
                 result = response['data']['refundPayment']
-                                
-                # Safe conversion for amounts
-                refunded_amount = result.get('refundedAmount')
-                last_refund_amount = result.get('lastRefundAmount')
-                
-                # Safe handling of updatedAt
-                updated_at = result.get('updatedAt')
-                
-                self.payment_id.write({
-                    'status': result.get('status'),
-                    'status_code': result.get('statusCode', ''),
-                    'status_message': result.get('statusMessage', ''),
-                    'refunded_amount': float(refunded_amount) / 100 if refunded_amount is not None else 0,
-                    'last_refund_amount': float(last_refund_amount) / 100 if last_refund_amount is not None else 0,
-                    'last_refund_reason': result.get('lastRefundReason') if result.get('lastRefundReason') is not None else '',
-                    'updated_at': self._parse_datetime(updated_at) if updated_at else False,
-                })
+                self.payment_id.write(CHARGE_RESPONSE_MAPPING.to_vals(result, partial=True))
                 return {
                     'type': 'ir.actions.act_window',
                     'res_model': 'monei.payment',
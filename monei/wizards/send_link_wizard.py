@@ -3,6 +3,7 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from ..graphql.mutations import SEND_PAYMENT_LINK_MUTATION
 from ..services.api_service import MoneiAPIService
+from ..utils.profiling import profiled
 
 class MoneiPaymentSendLinkWizard(models.TransientModel):
     _name = 'monei.payment.send.link.wizard'
@@ -52,6 +53,7 @@ class MoneiPaymentSendLinkWizard(models.TransientModel):
             if record.channel in ['WHATSAPP', 'SMS'] and record.notification_phone:
                 self._validate_phone(record.notification_phone, 'notification_phone')
 
+    @profiled('send_link_wizard')
     def action_send_link(self):
         self.ensure_one()
 
@@ -65,7 +67,7 @@ class MoneiPaymentSendLinkWizard(models.TransientModel):
                 raise UserError(_('Phone is required for %s channel') % self.channel.lower())
             clean_phone = self._validate_phone(self.notification_phone, 'notification_phone')
 
-        api_service = MoneiAPIService(self.env)
+        api_service = MoneiAPIService(self.env, company=self.payment_id.company_id)
         variables = {
             'input': {
                 'paymentId': self.payment_id.name,
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Payment sync throughput benchmark
+
+Feeds synthetic charges (see charge_factory.py) through
+``monei.payment._process_payment_batch`` and ``action_sync_payments`` and
+reports wall time, rows per second, SQL query counts and peak Python memory
+for each scenario. Every scenario runs in its own transaction which is
+rolled back, so the database is left untouched.
+
+Usage:
+    # Throwaway database with the module installed
+    odoo-bin -c odoo.conf -d monei_bench -i monei --stop-after-init
+
+    python scripts/benchmark/benchmark_sync.py -c odoo.conf -d monei_bench \\
+        --charges 100000 --output bench_results.jsonl
+
+Results are appended as JSON lines to --output (with the git revision), so
+runs of different revisions can be compared over time.
+
+By default the sync scenario is served by an in-process fake of the API.
+With --api-url it goes through the real HTTP client against that endpoint
+instead, e.g. monei_standin.py started with the same --charges and --seed.
+"""
+import argparse
+import contextlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from charge_factory import ACCOUNT_ID, charges_page, generate_charges, make_stores  # noqa: E402
+
+SIZE_RE = re.compile(r'size:\s*(\d+)')
+FROM_RE = re.compile(r'from:\s*(\d+)')
+RANGE_RE = re.compile(r'range:\s*\[([\d,\s]+)\]')
+OPERATION_RE = re.compile(r'^\s*query\s+(\w+)')
+
+
+class FakeMoneiAPI:
+    """Serve the generated dataset in place of the MONEI GraphQL API"""
+
+    def __init__(self, charges, stores):
+        self.charges = charges
+        self.stores = stores
+        self.calls = 0
+
+    def execute_query(self, query, variables=None):
+        self.calls += 1
+        # The charges queries are anonymous
+        operation_match = OPERATION_RE.match(query)
+        operation = operation_match and operation_match.group(1)
+        if operation == 'Account':
+            # The account of the charges, so that obsolete payments are looked for
+            return {'data': {'account': {'id': ACCOUNT_ID, 'apiKey': None}}}
+        if operation == 'Stores':
+            return {'data': {'stores': {'items': self.stores}}}
+        charges = self.charges
+        range_match = RANGE_RE.search(query)
+        if range_match:
+            bounds = [int(value) for value in range_match.group(1).split(',')]
+            low, high = bounds[0], bounds[1] if len(bounds) > 1 else float('inf')
+            charges = [charge for charge in charges if low <= charge['createdAt'] <= high]
+        size_match = SIZE_RE.search(query)
+        from_match = FROM_RE.search(query)
+        size = int(size_match.group(1)) if size_match else 10
+        start = int(from_match.group(1)) if from_match else 0
+        return charges_page(charges, start, size)
+
+
+@contextlib.contextmanager
+def measure(cr, result, rows, track_memory):
+    """Record duration, SQL query count and peak memory of the block"""
+    queries_before = cr.sql_log_count
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        result.update({
+            'rows': rows,
+            'seconds': round(duration, 3),
+            'rows_per_second': round(rows / duration, 1) if duration else None,
+            'queries': cr.sql_log_count - queries_before,
+            'queries_per_row': round((cr.sql_log_count - queries_before) / rows, 2) if rows else None,
+        })
+        if track_memory:
+            result['peak_memory_mb'] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+            tracemalloc.stop()
+
+
+def run_batch_scenario(env, charges, stores, page_size, track_memory):
+    """Insert then re-process the charges page by page"""
+    Payment = env['monei.payment']
+    store_ids = {
+        store.store_ref: store.id
+        for store in env['monei.store'].create([
+            {'name': store['name'], 'store_ref': store['id']} for store in stores
+        ])
+    }
+    results = []
+    for label in ('batch_insert', 'batch_unchanged'):
+        result = {'scenario': label}
+        with measure(env.cr, result, len(charges), track_memory):
+            for start in range(0, len(charges), page_size):
+                Payment._process_payment_batch(charges[start:start + page_size], store_ids)
+            env.flush_all()
+        results.append(result)
+    return results
+
+
+def run_sync_scenario(env, charges, stores, track_memory, api_url=None):
+    """Run the full sync twice: import, then resync
+
+    Without api_url the API is replaced by FakeMoneiAPI, otherwise the real
+    client talks to api_url. A dummy API key is set when none is configured
+    (the parameters are rolled back with the run).
+    """
+    from odoo.addons.monei.services.api_service import MoneiAPIService
+
+    fake_api = FakeMoneiAPI(charges, stores)
+    config = env['ir.config_parameter']
+    # The sync refuses to start without a key, even against FakeMoneiAPI
+    if not env.company.monei_api_key and not config.get_param('monei.api_key'):
+        config.set_param('monei.api_key', 'pk_test_' + '0' * 32)
+    if api_url:
+        config.set_param('monei.graphql_url', api_url)
+        api_patch = contextlib.nullcontext()
+    else:
+        api_patch = patch.object(
+            MoneiAPIService, 'execute_query',
+            lambda self, query, variables=None, timeout=None: fake_api.execute_query(query, variables),
+        )
+
+    results = []
+    with api_patch:
+        for label in ('sync_import', 'sync_resync'):
+            result = {'scenario': label}
+            fake_api.calls = 0
+            with measure(env.cr, result, len(charges), track_memory):
+                env['monei.payment'].action_sync_payments()
+                env.flush_all()
+            if not api_url:
+                result['api_calls'] = fake_api.calls
+            results.append(result)
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-c', '--config', help='Odoo configuration file')
+    parser.add_argument('-d', '--database', required=True, help='Throwaway database with the monei module installed')
+    parser.add_argument('--charges', type=int, default=10000, help='Number of synthetic charges (default: 10000)')
+    parser.add_argument('--page-size', type=int, default=1000, help='Charges per batch (default: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='Dataset seed (default: 0)')
+    parser.add_argument('--scenario', choices=['batch', 'sync', 'all'], default='all')
+    parser.add_argument('--no-memory', action='store_true', help='Do not trace memory (tracing slows the run down)')
+    parser.add_argument('--api-url', help='Sync against this GraphQL endpoint (e.g. monei_standin.py) instead of the in-process fake')
+    parser.add_argument('--output', help='Append the results as JSON lines to this file')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    import odoo
+    from odoo import SUPERUSER_ID, api
+
+    odoo_args = ['-d', args.database]
+    if args.config:
+        odoo_args = ['-c', args.config] + odoo_args
+    odoo.tools.config.parse_config(odoo_args)
+    registry = odoo.modules.registry.Registry(args.database)
+
+    stores = make_stores(seed=args.seed)
+    charges = generate_charges(args.charges, seed=args.seed, stores=stores)
+    track_memory = not args.no_memory
+
+    scenarios = []
+    if args.scenario in ('batch', 'all'):
+        scenarios.append(lambda env: run_batch_scenario(env, charges, stores, args.page_size, track_memory))
+    if args.scenario in ('sync', 'all'):
+        scenarios.append(lambda env: run_sync_scenario(env, charges, stores, track_memory, args.api_url))
+
+    results = []
+    for scenario in scenarios:
+        with registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            try:
+                results.extend(scenario(env))
+            finally:
+                cr.rollback()
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'database': args.database,
+        'charges': args.charges,
+        'page_size': args.page_size,
+        'seed': args.seed,
+        'api_url': args.api_url,
+    }
+    print(f"{'scenario':<18}{'rows':>9}{'seconds':>10}{'rows/s':>10}{'queries':>10}{'q/row':>8}{'peak MB':>9}")
+    for result in results:
+        print(
+            f"{result['scenario']:<18}{result['rows']:>9}{result['seconds']:>10}"
+            f"{result['rows_per_second'] or 0:>10}{result['queries']:>10}"
+            f"{result['queries_per_row'] or 0:>8}{result.get('peak_memory_mb', '-'):>9}"
+        )
+        if args.output:
+            with open(args.output, 'a') as output:
+                output.write(json.dumps(dict(run, **result)) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+"""Synthetic MONEI charges shaped like the CHARGES_QUERY items
+
+The generator is deterministic for a given seed, so benchmark runs over the
+same dataset can be compared with each other.
+"""
+import random
+import time
+
+# MONEI account of the generated charges
+ACCOUNT_ID = 'bench_account'
+
+PAYMENT_METHODS = [
+    # (method, weight)
+    ('card', 55),
+    ('cardPresent', 8),
+    ('bizum', 12),
+    ('paypal', 8),
+    ('sepa', 4),
+    ('klarna', 3),
+    ('mbway', 3),
+    ('cofidis', 2),
+    ('cofidisLoan', 2),
+    ('trustly', 3),
+]
+
+STATUSES = [
+    ('SUCCEEDED', 70),
+    ('FAILED', 10),
+    ('PENDING', 5),
+    ('CANCELED', 3),
+    ('REFUNDED', 4),
+    ('PARTIALLY_REFUNDED', 3),
+    ('AUTHORIZED', 3),
+    ('EXPIRED', 2),
+]
+
+CARD_BRANDS = ['visa', 'mastercard', 'amex', 'diners', 'jcb', 'unionpay']
+TOKENIZATION_METHODS = [None, None, None, 'applePay', 'googlePay', 'clickToPay']
+COUNTRIES = ['ES', 'PT', 'FR', 'DE', 'IT', 'NL', 'GB', 'US']
+BROWSERS = [('Chrome', '126.0'), ('Safari', '17.5'), ('Firefox', '127.0'), ('Edge', '126.0')]
+OS_LIST = [('Windows', '10'), ('Mac OS', '14.5'), ('iOS', '17.5'), ('Android', '14')]
+FIRST_NAMES = ['Ana', 'Luis', 'Marta', 'Jordi', 'Laura', 'Pablo', 'Sofia', 'Carlos', 'Elena', 'Javier']
+LAST_NAMES = ['Garcia', 'Martinez', 'Lopez', 'Sanchez', 'Perez', 'Gomez', 'Ruiz', 'Diaz', 'Moreno', 'Alvarez']
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _address(rng):
+    return {
+        'city': rng.choice(['Madrid', 'Barcelona', 'Valencia', 'Sevilla', 'Malaga', 'Lisboa']),
+        'country': rng.choice(COUNTRIES),
+        'line1': f'Calle {rng.choice(LAST_NAMES)} {rng.randint(1, 200)}',
+        'line2': rng.choice([None, f'Piso {rng.randint(1, 9)}']),
+        'zip': f'{rng.randint(1000, 52999):05d}',
+        'state': rng.choice([None, 'Madrid', 'Catalunya', 'Andalucia']),
+    }
+
+
+def _contact(rng, name, email, phone):
+    return {
+        'email': email,
+        'name': name,
+        'company': rng.choice([None, None, f'{rng.choice(LAST_NAMES)} SL']),
+        'phone': phone,
+        'address': _address(rng),
+        'taxId': rng.choice([None, f'B{rng.randint(10000000, 99999999)}']),
+    }
+
+
+def _device(rng, with_screen):
+    browser, browser_version = rng.choice(BROWSERS)
+    os_name, os_version = rng.choice(OS_LIST)
+    details = {
+        'ip': f'{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}',
+        'userAgent': f'Mozilla/5.0 ({os_name} {os_version}) {browser}/{browser_version}',
+        'countryCode': rng.choice(COUNTRIES),
+        'lang': rng.choice(['es', 'en', 'ca', 'pt', 'fr']),
+        'deviceType': rng.choice(['desktop', 'mobile', 'tablet']),
+        'deviceModel': rng.choice([None, 'iPhone', 'Pixel 8', 'Galaxy S24']),
+        'browser': browser,
+        'browserVersion': browser_version,
+        'browserAccept': 'text/html,application/xhtml+xml',
+        'os': os_name,
+        'osVersion': os_version,
+        'source': rng.choice(['MONEI/Odoo', 'MONEI/PrestaShop', 'MONEI/WooCommerce', None]),
+        'sourceVersion': rng.choice(['1.0.0', '2.1.3', None]),
+    }
+    if with_screen:
+        details.update({
+            'browserColorDepth': 24,
+            'browserScreenHeight': rng.choice([768, 900, 1080, 1440]),
+            'browserScreenWidth': rng.choice([1366, 1440, 1920, 2560]),
+            'browserTimezoneOffset': rng.choice([-120, -60, 0]),
+        })
+    return details
+
+
+def _payment_method(rng, method, name, email, phone):
+    payment_method = {'method': method}
+    if method in ('card', 'cardPresent'):
+        card = {
+            'brand': rng.choice(CARD_BRANDS),
+            'country': rng.choice(COUNTRIES),
+            'type': rng.choice(['credit', 'debit']),
+            'last4': f'{rng.randint(0, 9999):04d}',
+            'cardholderName': name,
+            'cardholderEmail': email,
+            'expiration': rng.randint(1735689600, 1893456000),
+        }
+        if method == 'card':
+            three_d_secure = rng.random() < 0.8
+            card.update({
+                'threeDSecure': three_d_secure,
+                'threeDSecureVersion': '2.2.0' if three_d_secure else None,
+                'threeDSecureFlow': rng.choice(['FRICTIONLESS', 'CHALLENGE']) if three_d_secure else None,
+                'bank': rng.choice(['CaixaBank', 'BBVA', 'Santander', 'Sabadell', None]),
+                'tokenizationMethod': rng.choice(TOKENIZATION_METHODS),
+            })
+        else:
+            card['bin'] = f'{rng.randint(400000, 559999)}'
+        payment_method[method] = card
+    elif method == 'bizum':
+        payment_method['bizum'] = {'phoneNumber': phone, 'integrationType': rng.choice(['REDSYS', 'MONEI'])}
+    elif method == 'paypal':
+        payment_method['paypal'] = {
+            'orderId': f'{rng.getrandbits(64):016X}',
+            'payerId': f'{rng.getrandbits(48):012X}',
+            'email': email,
+            'name': name,
+        }
+    elif method in ('cofidis', 'cofidisLoan'):
+        payment_method[method] = {'orderId': f'{rng.getrandbits(40):010x}'}
+    elif method == 'trustly':
+        payment_method['trustly'] = {'customerId': f'{rng.getrandbits(40):010x}'}
+    elif method == 'sepa':
+        payment_method['sepa'] = {
+            'accountholderAddress': _address(rng),
+            'accountholderEmail': email,
+            'accountholderName': name,
+            'countryCode': rng.choice(COUNTRIES),
+            'bankAddress': None,
+            'bankCode': f'{rng.randint(1000, 9999)}',
+            'bankName': rng.choice(['CaixaBank', 'BBVA', 'ING']),
+            'bic': rng.choice(['CAIXESBBXXX', 'BBVAESMMXXX', 'INGDESMMXXX']),
+            'last4': f'{rng.randint(0, 9999):04d}',
+        }
+    elif method == 'klarna':
+        payment_method['klarna'] = {
+            'billingCategory': rng.choice(['PAY_LATER', 'PAY_NOW', 'SLICE_IT']),
+            'authPaymentMethod': rng.choice(['invoice', 'direct_debit', 'card']),
+        }
+    elif method == 'mbway':
+        payment_method['mbway'] = {'phoneNumber': phone}
+    return payment_method
+
+
+def make_charge(rng, index, created_at, store_ids=(), account_id=ACCOUNT_ID):
+    """Build a single charge dict with the CHARGES_QUERY shape"""
+    method = _weighted(rng, PAYMENT_METHODS)
+    status = _weighted(rng, STATUSES)
+    amount = rng.randint(100, 50000)
+    first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f'{first_name} {last_name}'
+    email = f'{first_name.lower()}.{last_name.lower()}{index}@example.com'
+    phone = f'+346{rng.randint(10000000, 99999999)}'
+    refunded_amount = {
+        'REFUNDED': amount,
+        'PARTIALLY_REFUNDED': amount // 2,
+    }.get(status)
+
+    return {
+        'id': f'{index:08x}{rng.getrandbits(128):032x}',
+        'accountId': account_id,
+        'providerId': rng.choice([None, f'prov_{rng.getrandbits(32):08x}']),
+        'checkoutId': f'{rng.getrandbits(160):040x}',
+        'providerInternalId': rng.choice([None, f'{rng.getrandbits(48):012x}']),
+        'providerReferenceId': rng.choice([None, f'{rng.getrandbits(48):012x}']),
+        'createdAt': created_at,
+        'updatedAt': created_at + rng.randint(0, 3600),
+        'amount': amount,
+        'authorizationCode': f'{rng.randint(0, 999999):06d}' if status != 'FAILED' else None,
+        'billingDetails': _contact(rng, name, email, phone) if rng.random() < 0.6 else None,
+        'billingPlan': rng.choice([None, None, None, 'MONTHLY_3']),
+        'currency': 'EUR',
+        'customer': {'email': email, 'name': name, 'phone': phone},
+        'description': f'Order #{index}',
+        'descriptor': 'MONEI*BENCH',
+        'livemode': False,
+        'orderId': f'S{index:06d}',
+        'storeId': rng.choice(store_ids) if store_ids else None,
+        'pointOfSaleId': None,
+        'terminalId': None,
+        'sequenceId': None,
+        'subscriptionId': None,
+        'paymentMethod': _payment_method(rng, method, name, email, phone),
+        'cancellationReason': 'requested_by_customer' if status == 'CANCELED' else None,
+        'lastRefundAmount': refunded_amount,
+        'lastRefundReason': 'requested_by_customer' if refunded_amount else None,
+        'refundedAmount': refunded_amount,
+        'shippingDetails': _contact(rng, name, email, phone) if rng.random() < 0.4 else None,
+        'shop': {'name': 'Bench Shop', 'country': 'ES'},
+        'status': status,
+        'statusCode': 'E000' if status != 'FAILED' else rng.choice(['E101', 'E201', 'E501']),
+        'statusMessage': 'Transaction Approved' if status != 'FAILED' else 'Transaction Declined',
+        'sessionDetails': _device(rng, with_screen=True),
+        'traceDetails': dict(
+            _device(rng, with_screen=False),
+            userId=None, userEmail=None, userName=None,
+        ),
+        'pageOpenedAt': created_at - rng.randint(5, 600),
+        'metadata': [
+            {'key': 'orderRef', 'value': f'REF-{index:07d}'},
+            {'key': 'channel', 'value': rng.choice(['web', 'app', 'pos'])},
+        ],
+    }
+
+
+def make_stores(count=3, seed=0):
+    """Build the stores list returned by STORES_QUERY"""
+    rng = random.Random(seed)
+    return [
+        {'id': f'{rng.getrandbits(128):032x}', 'name': f'Bench Store {i + 1}'}
+        for i in range(count)
+    ]
+
+
+def generate_charges(count, seed=0, stores=None, days=30, end=None):
+    """Generate count charges spread over the last days, newest first
+
+    Args:
+        count: Number of charges to generate
+        seed: Random seed, the same seed always yields the same charges
+        stores: Stores as returned by make_stores, used for storeId
+        days: Number of days the charges are spread over
+        end: Unix timestamp of the newest charge (default: now)
+
+    Returns:
+        list: Charge dicts, ordered by createdAt descending like the API
+    """
+    rng = random.Random(seed)
+    end = int(end or time.time())
+    span = days * 86400
+    store_ids = [store['id'] for store in stores or []]
+    timestamps = sorted((end - rng.randint(0, span) for _ in range(count)), reverse=True)
+    return [
+        make_charge(rng, index, created_at, store_ids)
+        for index, created_at in enumerate(timestamps)
+    ]
+
+
+def charges_page(charges, start=0, size=1000):
+    """Build a CHARGES_QUERY response for a page of charges"""
+    return {
+        'data': {
+            'charges': {
+                'items': charges[start:start + size],
+                'total': len(charges),
+            }
+        }
+    }
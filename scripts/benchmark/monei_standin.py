@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Local stand-in for the MONEI GraphQL API
+
+Serves the operations used by the module (charges, charge, stores,
+availablePaymentMethods, account and the payment mutations) over a seeded
+synthetic dataset, so sync, bulk mutations and retry behaviour can be load
+tested without a MONEI account. Operations are recognised by name rather
+than by a full GraphQL parser, and responses always carry every charge
+field whatever the selection set.
+
+Usage:
+    python scripts/benchmark/monei_standin.py --charges 50000 --port 8765 \\
+        --latency 150 --jitter 50 --error-rate 0.01 --rate-limit 20
+
+Latency is in milliseconds. --rate-limit is the number of requests per
+second above which the server answers 429 with a Retry-After header, and
+--throttle-rate answers 429 to that fraction of requests regardless of load.
+
+Point Odoo at the stand-in by setting the GraphQL API URL in the MONEI
+settings (system parameter monei.graphql_url) to http://127.0.0.1:8765, or
+pass --api-url to benchmark_sync.py.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from charge_factory import ACCOUNT_ID, charges_page, generate_charges, make_charge, make_stores  # noqa: E402
+
+SIZE_RE = re.compile(r'size:\s*(\d+)')
+FROM_RE = re.compile(r'from:\s*(\d+)')
+RANGE_RE = re.compile(r'range:\s*\[([\d,\s]+)\]')
+CHARGE_ID_RE = re.compile(r'charge\(id:\s*"([^"]+)"\)')
+
+PAYMENT_METHODS = [
+    {'paymentMethod': method, 'configured': True, 'enabled': True}
+    for method in ('card', 'bizum', 'paypal', 'sepa', 'klarna', 'mbway', 'cofidis')
+]
+
+
+class RateLimiter:
+    """Fixed one second window request counter"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.window = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        if not self.limit:
+            return True
+        with self.lock:
+            window = int(time.time())
+            if window != self.window:
+                self.window, self.count = window, 0
+            self.count += 1
+            return self.count <= self.limit
+
+
+class Dataset:
+    """Seeded charges and stores, mutated by the payment mutations"""
+
+    def __init__(self, charge_count, seed):
+        self.rng = random.Random(seed)
+        self.stores = make_stores(seed=seed)
+        self.charges = generate_charges(charge_count, seed=seed, stores=self.stores)
+        self.by_id = {charge['id']: charge for charge in self.charges}
+        self.lock = threading.Lock()
+
+    def charges_response(self, query, variables):
+        charges = self.charges
+        range_match = RANGE_RE.search(query)
+        if range_match:
+            bounds = [int(value) for value in range_match.group(1).split(',')]
+            low, high = bounds[0], bounds[1] if len(bounds) > 1 else float('inf')
+            charges = [charge for charge in charges if low <= charge['createdAt'] <= high]
+        size_match = SIZE_RE.search(query)
+        from_match = FROM_RE.search(query)
+        size = int(size_match.group(1)) if size_match else variables.get('size', 10)
+        start = int(from_match.group(1)) if from_match else variables.get('from', 0)
+        return charges_page(charges, start, size)
+
+    def charge(self, charge_id):
+        return self.by_id.get(charge_id)
+
+    def update(self, charge_id, **values):
+        with self.lock:
+            charge = self.by_id.get(charge_id)
+            if charge is None:
+                raise LookupError(f'Payment {charge_id} not found')
+            charge.update(values, updatedAt=int(time.time()))
+            return charge
+
+    def create(self, payment_input):
+        with self.lock:
+            now = int(time.time())
+            charge = make_charge(self.rng, len(self.charges), now, [store['id'] for store in self.stores])
+            charge.update({
+                'amount': payment_input.get('amount'),
+                'currency': payment_input.get('currency', 'EUR'),
+                'orderId': payment_input.get('orderId'),
+                'description': payment_input.get('description'),
+                'customer': payment_input.get('customer') or charge['customer'],
+                'status': 'PENDING',
+                'statusCode': None,
+                'statusMessage': None,
+                'refundedAmount': None,
+                'lastRefundAmount': None,
+                'lastRefundReason': None,
+            })
+            self.charges.insert(0, charge)
+            self.by_id[charge['id']] = charge
+            return charge
+
+
+def resolve(dataset, query, variables, api_key):
+    """Return the GraphQL data for the operation in the query"""
+    payment_input = variables.get('input') or {}
+    if 'cancelPayment' in query:
+        return {'cancelPayment': dataset.update(
+            payment_input['paymentId'],
+            status='CANCELED',
+            cancellationReason=payment_input.get('cancellationReason'),
+        )}
+    if 'refundPayment' in query:
+        charge = dataset.charge(payment_input['paymentId']) or {}
+        refund = payment_input.get('amount') or (charge.get('amount') or 0) - (charge.get('refundedAmount') or 0)
+        refunded = (charge.get('refundedAmount') or 0) + refund
+        return {'refundPayment': dataset.update(
+            payment_input['paymentId'],
+            status='REFUNDED' if refunded >= (charge.get('amount') or 0) else 'PARTIALLY_REFUNDED',
+            refundedAmount=refunded,
+            lastRefundAmount=refund,
+            lastRefundReason=payment_input.get('refundReason'),
+        )}
+    if 'capturePayment' in query:
+        charge = dataset.charge(payment_input['paymentId']) or {}
+        return {'capturePayment': dataset.update(
+            payment_input['paymentId'],
+            status='SUCCEEDED',
+            amount=payment_input.get('amount') or charge.get('amount'),
+        )}
+    if 'createPayment' in query:
+        return {'createPayment': dataset.create(payment_input)}
+    if 'sendPaymentLink' in query:
+        return {'sendPaymentLink': {'id': payment_input.get('paymentId')}}
+    if 'availablePaymentMethods' in query:
+        return {'availablePaymentMethods': PAYMENT_METHODS}
+    if 'stores' in query:
+        return {'stores': {'items': dataset.stores}}
+    if 'charges' in query:
+        return dataset.charges_response(query, variables)['data']
+    if 'charge(' in query:
+        match = CHARGE_ID_RE.search(query)
+        return {'charge': dataset.charge(variables.get('id') or (match and match.group(1)))}
+    # Checked last, charge selections also contain accountId
+    if 'account' in query:
+        # The account of the charges, so that the sync can tell obsolete payments
+        return {'account': {'id': ACCOUNT_ID, 'apiKey': api_key}}
+    raise ValueError('Unsupported operation')
+
+
+def make_handler(dataset, options, limiter):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            if options.verbose:
+                super().log_message(format, *args)
+
+        def _send(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+            delay = options.latency + random.uniform(-options.jitter, options.jitter)
+            if delay > 0:
+                time.sleep(delay / 1000.0)
+
+            if not limiter.allow() or random.random() < options.throttle_rate:
+                return self._send(429, {'message': 'Too Many Requests'}, {'Retry-After': '1'})
+            if random.random() < options.error_rate:
+                if random.random() < 0.5:
+                    return self._send(500, {'message': 'Injected server error'})
+                return self._send(200, {'errors': [{'message': 'Injected GraphQL error'}]})
+
+            authorization = self.headers.get('Authorization', '')
+            if not authorization.startswith('Bearer '):
+                return self._send(401, {'errors': [{'message': 'Unauthorized'}]})
+
+            try:
+                request = json.loads(body or b'{}')
+                data = resolve(
+                    dataset,
+                    request.get('query', ''),
+                    request.get('variables') or {},
+                    authorization[len('Bearer '):],
+                )
+            except Exception as e:
+                return self._send(200, {'errors': [{'message': str(e)}]})
+            return self._send(200, {'data': data})
+
+    return StandInHandler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--charges', type=int, default=10000, help='Number of seeded charges (default: 10000)')
+    parser.add_argument('--seed', type=int, default=0, help='Dataset seed (default: 0)')
+    parser.add_argument('--latency', type=float, default=0, help='Added latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=0, help='Random latency variation in ms')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests failing (500 or GraphQL error)')
+    parser.add_argument('--throttle-rate', type=float, default=0, help='Fraction of requests answered with 429')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requests per second before answering 429 (0: no limit)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log every request')
+    return parser.parse_args()
+
+
+def main():
+    options = parse_args()
+    dataset = Dataset(options.charges, options.seed)
+    server = ThreadingHTTPServer(
+        (options.host, options.port),
+        make_handler(dataset, options, RateLimiter(options.rate_limit)),
+    )
+    print(f'MONEI stand-in serving {len(dataset.charges)} charges on http://{options.host}:{options.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()